@@ -1,8 +1,11 @@
 """Cards."""
 
 import random
-from collections import Counter
+from array import array
 from enum import Enum, IntEnum, auto
+from functools import cache, cached_property, lru_cache
+from itertools import combinations_with_replacement
+from operator import attrgetter
 from typing import Self  # Python 3.11+ only
 
 # ruff: noqa: S311, INP001
@@ -39,6 +42,42 @@ class Suit(Enum):
     SPADES = auto()
 
 
+# Cards are packed into a 6-bit int: suit index in bits 4-5, rank value (2-14) in bits 0-3
+RANK_BITS = 0xF
+SUIT_SHIFT = 4
+
+_ALL_RANKS: tuple[Rank, ...] = tuple(Rank)
+_ALL_SUITS: tuple[Suit, ...] = tuple(Suit)  # also maps suit index -> Suit
+_RANK_BY_VALUE: tuple[Rank | None, ...] = (None, None, *_ALL_RANKS)  # rank value -> Rank
+
+# Display names, indexed like the code fields (rank value, suit index)
+_RANK_NAMES: tuple[str, ...] = ("", "", *(rank.name.title() for rank in _ALL_RANKS))
+_SUIT_NAMES: tuple[str, ...] = tuple(suit.name.title() for suit in _ALL_SUITS)
+
+# Rank bitmasks (bit n set for rank value n): the wheel, and every straight -> its high card
+WHEEL_MASK = 0x403C  # A-2-3-4-5
+_STRAIGHT_HIGH: dict[int, Rank] = {0x1F << (high - 4): high for high in _ALL_RANKS[4:]} | {WHEEL_MASK: Rank.FIVE}
+
+# Blackjack value by rank value: number cards at face value, J/Q/K 10, ace 11
+_BLACKJACK_VALUE = (0, 0, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 11)
+
+# Sort key for cards by rank; Rank is an IntEnum, so ranks compare as ints without .value
+_RANK_KEY = attrgetter("rank")
+
+# One prime per rank value (Cactus Kev), so the product of a hand's primes identifies its ranks
+_RANK_PRIMES = (0, 0, 2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
+def encode_card(rank: Rank, suit: Suit) -> int:
+    """Pack a rank and suit into a card code.
+
+    Returns:
+        int: card code, (suit_index << 4) | rank_value
+
+    """
+    return ((suit.value - 1) << SUIT_SHIFT) | rank.value
+
+
 class Card:
     """Class for a playing card.
 
@@ -52,10 +91,28 @@ class Card:
 
     """
 
+    __slots__ = ("code",)
+
     def __init__(self, rank: Rank, suit: Suit) -> None:
         """Initialize a card."""
-        self.rank = rank
-        self.suit = suit
+        self.code = encode_card(rank, suit)
+
+    @property
+    def rank(self) -> Rank:
+        """Get the rank of the card."""
+        return _RANK_BY_VALUE[self.code & RANK_BITS]
+
+    @property
+    def suit(self) -> Suit:
+        """Get the suit of the card."""
+        return _ALL_SUITS[self.code >> SUIT_SHIFT]
+
+    @classmethod
+    def from_code(cls, code: int) -> Self:
+        """Build a card of a given class/subclass from its packed code."""
+        card = cls.__new__(cls)
+        card.code = code
+        return card
 
     def __str__(self) -> str:
         """Show the string representation of the card.
@@ -64,12 +121,13 @@ class Card:
             str: string representation of the card (e.g., "Ace of Spades")
 
         """
-        return f"{self.rank.name.title()} of {self.suit.name.title()}"
+        code = self.code
+        return _RANK_NAMES[code & RANK_BITS] + " of " + _SUIT_NAMES[code >> SUIT_SHIFT]
 
     @classmethod
     def random_card(cls) -> Self:
         """Generate a random card of a given class/subclass."""
-        return cls(random.choice(list(Rank)), random.choice(list(Suit)))
+        return cls(random.choice(_ALL_RANKS), random.choice(_ALL_SUITS))
 
     @classmethod
     def generate_deck(cls) -> list[Self]:
@@ -79,25 +137,32 @@ class Card:
             list[Self]: list of Cards/subclass of Cards representing a standard 52-card deck
 
         """
-        return [cls(rank, suit) for suit in Suit for rank in Rank]
+        return list(_deck_for(cls))
+
+
+@cache
+def _deck_for(cls: type[Card]) -> tuple[Card, ...]:
+    """Build the 52-card deck for a card class once; cards are never mutated, so they are shared."""
+    return tuple(cls(rank, suit) for suit in _ALL_SUITS for rank in _ALL_RANKS)
 
 
 class BlackjackCard(Card):
     """Blackjack card."""
 
+    __slots__ = ()
+
     @property
     def value(self) -> int:
         """Get the blackjack value of the card."""
-        if self.rank in [Rank.JACK, Rank.QUEEN, Rank.KING]:
-            return 10  # if it's a jack, queen, or king, return 10
-        if self.rank == Rank.ACE:
-            return 11  # if it's an ace, return 11
-        return self.rank.value  # else, return the value given in the Rank enum
+        return _BLACKJACK_VALUE[self.code & RANK_BITS]
 
 
 class BlackjackHand:
     """Dataclass for blackjack hands.
 
+    Rank values are also kept in a compact byte array alongside the cards, so `cards`
+    is a read-only tuple and the only way to add a card is `add_card`.
+
     Args:
         cards (list[BlackjackCard], optional): list of blackjack cards in the hand
 
@@ -106,9 +171,22 @@ class BlackjackHand:
 
     """
 
+    __slots__ = ("_cards", "_ranks")
+
     def __init__(self, cards: list[BlackjackCard]) -> None:
         """Initialize a blackjack hand."""
-        self.cards = cards
+        self._cards = list(cards)  # own copy, so the caller's list can't desync _ranks
+        self._ranks = array("b", [card.code & RANK_BITS for card in cards])
+
+    def add_card(self, card: BlackjackCard) -> None:
+        """Add a card to the hand (e.g., on a hit)."""
+        self._cards.append(card)
+        self._ranks.append(card.code & RANK_BITS)
+
+    @property
+    def cards(self) -> tuple[BlackjackCard, ...]:
+        """Get the cards in the hand, in the order they were dealt."""
+        return tuple(self._cards)
 
     @property
     def value(self) -> int:
@@ -121,8 +199,9 @@ class BlackjackHand:
             int: total value of the hand
 
         """
-        total = sum(card.value for card in self.cards)  # initial total of the hand
-        aces = sum(1 for card in self.cards if card.rank == Rank.ACE)  # count the number of aces
+        ranks = self._ranks
+        total = sum(_BLACKJACK_VALUE[rank] for rank in ranks)  # initial total of the hand
+        aces = ranks.count(Rank.ACE)  # count the number of aces
 
         # while total is over 21 and aces are left
         while total > 21 and aces:  # noqa: PLR2004
@@ -134,6 +213,8 @@ class BlackjackHand:
 class PokerCard(Card):
     """Poker card."""
 
+    __slots__ = ()
+
 
 class PokerHandRank(IntEnum):
     """Enum for poker hand ranks, e.g., high card, pair, two pair, etc.
@@ -157,6 +238,9 @@ class PokerHandRank(IntEnum):
 class PokerHand:
     """Class for poker hands.
 
+    The hand is evaluated once, on first access to `rank`, `rank_cards`, `kickers` or
+    `evaluate()`, and the result is reused, so the cards should not be changed afterwards.
+
     Args:
         cards (list[PokerCard], optional): list of poker cards in the hand
 
@@ -169,190 +253,291 @@ class PokerHand:
         """Initialize a poker hand."""
         self.cards = cards
 
-    @property
-    def rank(self) -> PokerHandRank:  # noqa: C901, PLR0911
+    @classmethod
+    def from_codes(cls, codes: list[int]) -> Self:
+        """Build a poker hand from packed card codes.
+
+        Usage:
+            hand = PokerHand.from_codes([encode_card(Rank.ACE, Suit.SPADES), ...])
+
+        """
+        return cls([PokerCard.from_code(code) for code in codes])
+
+    @cached_property
+    def rank(self) -> PokerHandRank:
         """Evaluate the poker hand and determine its rank.
 
         Returns:
             PokerHandRank: rank of the poker hand
 
         """
+        return self.evaluate()[0]
+
+    @cached_property
+    def rank_cards(self) -> list[PokerCard]:
+        """Get the cards that form the winning rank.
+
+        For example, in a pair of Aces, returns the two Aces.
+        In a full house, returns the three of a kind and the pair.
+
+        Returns:
+            list[PokerCard]: cards that form the winning rank
+
+        """
+        return self.evaluate()[1]
+
+    @cached_property
+    def kickers(self) -> list[PokerCard]:
+        """Get the kicker cards (cards not part of the winning rank).
+
+        Returns:
+            list[PokerCard]: kicker cards sorted by rank in descending order
+
+        """
+        return self.evaluate()[2]
+
+    def evaluate(self) -> tuple[PokerHandRank, list[PokerCard], list[PokerCard]]:
+        """Evaluate the hand's rank, rank cards and kickers in one go.
+
+        Returns:
+            tuple[PokerHandRank, list[PokerCard], list[PokerCard]]: rank, rank cards, kickers
+
+        """
+        return self._evaluation
+
+    @cached_property
+    def _evaluation(self) -> tuple[PokerHandRank, list[PokerCard], list[PokerCard]]:
+        """Compute the histogram, flush and straight once and derive all three results from them."""
         maximum_hand_size = 5
         if len(self.cards) != maximum_hand_size:
             msg = "A poker hand must contain exactly 5 cards."
             raise ValueError(msg)
 
-        # Normalize ranks and suits
-        ranks = [card.rank.value for card in self.cards]
-        suits = [card.suit for card in self.cards]
+        # Hands with the same cards share one cached classification, whatever their order
+        signature = bytes(sorted(card.code for card in self.cards))
+        hand_rank, group_mask = _evaluate_signature(signature)
+        rank_cards, kickers = _partition_cards(self.cards, hand_rank, group_mask)
+        return hand_rank, rank_cards, kickers
 
-        # Count occurrences of each rank
-        counts = Counter(ranks)
-        counts_values = sorted(counts.values(), reverse=True)
 
-        # Check for flush (all suits equal)
-        is_flush = len(set(suits)) == 1
+# Rank of a hand by its shape: the rank counts in descending order
+_SHAPE_RANK: dict[tuple[int, ...], PokerHandRank] = {
+    (4, 1): PokerHandRank.FOUR_OF_A_KIND,
+    (3, 2): PokerHandRank.FULL_HOUSE,
+    (3, 1, 1): PokerHandRank.THREE_OF_A_KIND,
+    (2, 2, 1): PokerHandRank.TWO_PAIR,
+    (2, 1, 1, 1): PokerHandRank.ONE_PAIR,
+    (1, 1, 1, 1, 1): PokerHandRank.HIGH_CARD,
+}
 
-        # Check for straight. Handle wheel (A-2-3-4-5).
-        unique_ranks = sorted(set(ranks))
-        is_straight = False
-        if len(unique_ranks) == len(self.cards):
-            max_rank = max(unique_ranks)
-            min_rank = min(unique_ranks)
-            if max_rank - min_rank == len(self.cards) - 1 or set(unique_ranks) == {
-                Rank.ACE,
-                Rank.TWO,
-                Rank.THREE,
-                Rank.FOUR,
-                Rank.FIVE,
-            }:
-                is_straight = True
 
-        # Determine hand rank in order of strength
-        if is_straight and is_flush:
-            # Check for royal flush
-            if set(ranks) >= {Rank.TEN, Rank.JACK, Rank.QUEEN, Rank.KING, Rank.ACE}:
-                return PokerHandRank.ROYAL_FLUSH
-            return PokerHandRank.STRAIGHT_FLUSH
+def _classify(rank_mask: int, suit_mask: int, histogram: array) -> PokerHandRank:
+    """Classify a 5-card hand from its rank bitmask, suit bitmask and rank histogram.
 
-        if 4 in counts_values:  # noqa: PLR2004
-            return PokerHandRank.FOUR_OF_A_KIND
+    Returns:
+        PokerHandRank: rank of the poker hand
 
-        if counts_values[:2] == [3, 2]:
-            return PokerHandRank.FULL_HOUSE
+    """
+    # Check for flush (only one suit bit set)
+    is_flush = (suit_mask & (suit_mask - 1)) == 0
 
-        if is_flush:
-            return PokerHandRank.FLUSH
+    # Check for straight: the rank mask is one of the precomputed straights
+    straight_high = _STRAIGHT_HIGH.get(rank_mask)
 
-        if is_straight:
-            return PokerHandRank.STRAIGHT
+    if straight_high is not None and is_flush:
+        return PokerHandRank.ROYAL_FLUSH if straight_high == Rank.ACE else PokerHandRank.STRAIGHT_FLUSH
 
-        if 3 in counts_values:  # noqa: PLR2004
-            return PokerHandRank.THREE_OF_A_KIND
+    # Rank by shape, then upgrade to a flush or straight where those beat it
+    hand_rank = _SHAPE_RANK[tuple(sorted(filter(None, histogram), reverse=True))]
+    if hand_rank >= PokerHandRank.FULL_HOUSE:
+        return hand_rank
+    if is_flush:
+        return PokerHandRank.FLUSH
+    if straight_high is not None:
+        return PokerHandRank.STRAIGHT
+    return hand_rank
 
-        if counts_values.count(2) >= 2:  # noqa: PLR2004
-            return PokerHandRank.TWO_PAIR
 
-        if 2 in counts_values:  # noqa: PLR2004
-            return PokerHandRank.ONE_PAIR
+@lru_cache(maxsize=1 << 16)
+def _evaluate_signature(signature: bytes) -> tuple[PokerHandRank, int]:
+    """Classify a hand from its sorted card codes and find which ranks form the hand.
 
-        return PokerHandRank.HIGH_CARD
+    Returns:
+        tuple[PokerHandRank, int]: rank of the poker hand, bitmask of the ranks of its rank cards
 
-    @property
-    def rank_cards(self) -> list[PokerCard]:  # noqa: C901, PLR0911
-        """Get the cards that form the winning rank.
+    """
+    # Single pass over the packed codes: rank bitmask, suit bitmask, prime product and rank histogram
+    rank_mask = 0
+    suit_mask = 0
+    product = 1
+    histogram = array("b", bytes(RANK_BITS + 1))
+    for code in signature:
+        rank = code & RANK_BITS
+        rank_mask |= 1 << rank
+        suit_mask |= 1 << (code >> SUIT_SHIFT)
+        product *= _RANK_PRIMES[rank]
+        histogram[rank] += 1
+
+    # One table lookup instead of the classification ladder
+    if suit_mask & (suit_mask - 1) == 0:
+        hand_rank = _FLUSH_TABLE[product]
+    else:
+        hand_rank = _RANK_TABLE[product]
+
+    # Ranks that form the hand
+    if hand_rank == PokerHandRank.FOUR_OF_A_KIND:
+        group_mask = 1 << histogram.index(4)
+    elif hand_rank == PokerHandRank.THREE_OF_A_KIND:
+        group_mask = 1 << histogram.index(3)
+    elif hand_rank in (PokerHandRank.TWO_PAIR, PokerHandRank.ONE_PAIR):
+        # The second pair is searched for past the first
+        pair_rank = histogram.index(2)
+        group_mask = 1 << pair_rank
+        if hand_rank == PokerHandRank.TWO_PAIR:
+            group_mask |= 1 << histogram.index(2, pair_rank + 1)
+    elif hand_rank == PokerHandRank.HIGH_CARD:
+        group_mask = 1 << (rank_mask.bit_length() - 1)  # highest rank
+    else:
+        group_mask = rank_mask  # all cards form the rank
+    return hand_rank, group_mask
+
+
+def _partition_cards(
+    cards: list[PokerCard],
+    hand_rank: PokerHandRank,
+    group_mask: int,
+) -> tuple[list[PokerCard], list[PokerCard]]:
+    """Split a classified hand into the cards that form its rank and the kickers.
+
+    Returns:
+        tuple[list[PokerCard], list[PokerCard]]: rank cards, kickers sorted by rank in descending order
 
-        For example, in a pair of Aces, returns the two Aces.
-        In a full house, returns the three of a kind and the pair.
+    """
+    # Sort once; the partition below keeps the descending order
+    by_rank = sorted(cards, key=_RANK_KEY, reverse=True)
 
-        Returns:
-            list[PokerCard]: cards that form the winning rank
+    if hand_rank == PokerHandRank.STRAIGHT and group_mask == WHEEL_MASK:
+        # Wheel plays the ace low: A, 2, 3, 4, 5
+        return [by_rank[0], *by_rank[:0:-1]], []
 
-        """
-        maximum_hand_size = 5
-        if len(self.cards) != maximum_hand_size:
-            msg = "A poker hand must contain exactly 5 cards."
-            raise ValueError(msg)
+    rank_cards: list[PokerCard] = []
+    kickers: list[PokerCard] = []
+    for card in by_rank:
+        if group_mask >> (card.code & RANK_BITS) & 1:
+            rank_cards.append(card)
+        else:
+            kickers.append(card)
+    return rank_cards, kickers
 
-        # Normalize ranks and suits
-        ranks = [card.rank.value for card in self.cards]
-
-        # Count occurrences of each rank
-        counts = Counter(ranks)
-
-        if self.rank in (PokerHandRank.ROYAL_FLUSH, PokerHandRank.STRAIGHT_FLUSH):
-            # All cards form the rank
-            return sorted(self.cards, key=lambda c: c.rank.value, reverse=True)
-
-        if self.rank == PokerHandRank.FOUR_OF_A_KIND:
-            # Find the four cards of the same rank
-            four_rank = next(rank for rank, count in counts.items() if count == 4)  # noqa: PLR2004
-            return sorted(
-                [card for card in self.cards if card.rank.value == four_rank],
-                key=lambda c: c.rank.value,
-                reverse=True,
-            )
-
-        if self.rank == PokerHandRank.FULL_HOUSE:
-            # Find the three of a kind and the pair
-            three_rank = next(rank for rank, count in counts.items() if count == 3)  # noqa: PLR2004
-            pair_rank = next(rank for rank, count in counts.items() if count == 2)  # noqa: PLR2004
-            three_cards = [card for card in self.cards if card.rank.value == three_rank]
-            pair_cards = [card for card in self.cards if card.rank.value == pair_rank]
-            return sorted(three_cards + pair_cards, key=lambda c: c.rank.value, reverse=True)
-
-        if self.rank == PokerHandRank.FLUSH:
-            # All cards form the rank (flush)
-            return sorted(self.cards, key=lambda c: c.rank.value, reverse=True)
-
-        if self.rank == PokerHandRank.STRAIGHT:
-            # All cards form the rank (straight)
-            if {Rank.ACE, Rank.TWO, Rank.THREE, Rank.FOUR, Rank.FIVE}.issubset(set(ranks)):
-                return sorted(
-                    [
-                        card
-                        for card in self.cards
-                        if card.rank.value in {Rank.ACE, Rank.TWO, Rank.THREE, Rank.FOUR, Rank.FIVE}
-                    ],
-                    key=lambda c: c.rank.value if c.rank != Rank.ACE else 1,
-                )
-            return sorted(self.cards, key=lambda c: c.rank.value, reverse=True)
-
-        if self.rank == PokerHandRank.THREE_OF_A_KIND:
-            # Find the three cards of the same rank
-            three_rank = next(rank for rank, count in counts.items() if count == 3)  # noqa: PLR2004
-            return sorted(
-                [card for card in self.cards if card.rank.value == three_rank],
-                key=lambda c: c.rank.value,
-                reverse=True,
-            )
-
-        if self.rank == PokerHandRank.TWO_PAIR:
-            # Find the two pairs
-            pair_ranks = sorted(
-                [rank for rank, count in counts.items() if count == 2],  # noqa: PLR2004
-                reverse=True,
-            )
-            two_pair_cards = [card for card in self.cards if card.rank.value in pair_ranks]
-            return sorted(two_pair_cards, key=lambda c: c.rank.value, reverse=True)
-
-        if self.rank == PokerHandRank.ONE_PAIR:
-            # Find the pair
-            pair_rank = next(rank for rank, count in counts.items() if count == 2)  # noqa: PLR2004
-            return sorted(
-                [card for card in self.cards if card.rank.value == pair_rank],
-                key=lambda c: c.rank.value,
-                reverse=True,
-            )
-
-        # HIGH_CARD: return the highest card
-        return sorted(self.cards, key=lambda c: c.rank.value, reverse=True)[:1]
 
-    @property
-    def kickers(self) -> list[PokerCard]:
-        """Get the kicker cards (cards not part of the winning rank).
+def _build_lookup_tables() -> tuple[dict[int, PokerHandRank], dict[int, PokerHandRank]]:
+    """Classify every multiset of 5 ranks once, keyed by its prime product.
 
-        Returns:
-            list[PokerCard]: kicker cards sorted by rank in descending order
+    Returns:
+        tuple[dict[int, PokerHandRank], dict[int, PokerHandRank]]: ranks for suited and unsuited hands
 
-        """
-        rank_card_set = {id(card) for card in self.rank_cards}
-        kicker_list = [card for card in self.cards if id(card) not in rank_card_set]
-        return sorted(kicker_list, key=lambda c: c.rank.value, reverse=True)
+    """
+    flush_table: dict[int, PokerHandRank] = {}
+    rank_table: dict[int, PokerHandRank] = {}
+    for ranks in combinations_with_replacement(range(Rank.TWO, Rank.ACE + 1), 5):
+        rank_mask = 0
+        product = 1
+        histogram = array("b", bytes(RANK_BITS + 1))
+        for rank in ranks:
+            rank_mask |= 1 << rank
+            product *= _RANK_PRIMES[rank]
+            histogram[rank] += 1
+        if 5 in histogram:  # noqa: PLR2004
+            continue  # five of a rank cannot be dealt from one deck
+        flush_table[product] = _classify(rank_mask, 0b0001, histogram)
+        rank_table[product] = _classify(rank_mask, 0b0011, histogram)
+    return flush_table, rank_table
 
 
-if __name__ == "__main__":
-    # Example usage
-    deck = PokerCard.generate_deck()
+_FLUSH_TABLE, _RANK_TABLE = _build_lookup_tables()
+
+
+def rank_codes(codes: list[int]) -> PokerHandRank:
+    """Rank 5 packed card codes without building any Card or PokerHand objects.
+
+    Returns:
+        PokerHandRank: rank of the poker hand
+
+    """
+    suit_mask = 0
+    product = 1
+    for code in codes:
+        suit_mask |= 1 << (code >> SUIT_SHIFT)
+        product *= _RANK_PRIMES[code & RANK_BITS]
+    if suit_mask & (suit_mask - 1) == 0:
+        return _FLUSH_TABLE[product]
+    return _RANK_TABLE[product]
+
+
+def deal_batch(deck_codes: list[int], n: int, rng: random.Random | None = None) -> list[list[int]]:
+    """Deal n random 5-card hands at once, each without replacement from the deck.
+
+    Args:
+        deck_codes (list[int]): packed codes of the cards to deal from
+
+        n (int): number of hands to deal
+
+        rng (random.Random, optional): random generator to reuse, e.g. a seeded one for repeatable runs
+
+    Returns:
+        list[list[int]]: packed codes of each hand
+
+    """
+    rng = rng or random.Random()
+    deck = tuple(deck_codes)
+    indices = range(len(deck))
+    sample = rng.sample
+    # Sample 5 indices and look the codes up, rather than sampling the deck list itself
+    return [[deck[index] for index in sample(indices, 5)] for _ in range(n)]
+
+
+def sample_until(
+    deck_codes: list[int],
+    target: PokerHandRank,
+    required_rank: Rank | None = None,
+    rng: random.Random | None = None,
+    batch_size: int = 1024,
+) -> list[int]:
+    """Sample random 5-card hands until one has the target rank.
+
+    Works on packed card codes only; wrap the result with PokerHand.from_codes to display it.
+    Hands are dealt and ranked a batch at a time.
+
+    Args:
+        deck_codes (list[int]): packed codes of the cards to sample from
+
+        target (PokerHandRank): hand rank to look for
+
+        required_rank (Rank, optional): card rank that must also be in the hand
+
+        rng (random.Random, optional): random generator to reuse, e.g. a seeded one for repeatable runs
+
+        batch_size (int, optional): number of hands dealt per batch
+
+    Returns:
+        list[int]: packed codes of the first matching hand
+
+    """
+    rng = rng or random.Random()
     while True:
-        random_hand = random.sample(deck, 5)
-        poker_hand = PokerHand(random_hand)
-        # Look for a certain hand for testing
-        if poker_hand.rank == PokerHandRank.STRAIGHT and Rank.ACE in [
-            card.rank for card in poker_hand.cards
-        ]:
-            print("Hand:", ", ".join(str(card) for card in poker_hand.cards))
-            print("Hand Rank:", poker_hand.rank.value)
-            print("Rank Cards:", ", ".join(str(card) for card in poker_hand.rank_cards))
-            print("Kickers:", ", ".join(str(card) for card in poker_hand.kickers))
-            break
+        batch = deal_batch(deck_codes, batch_size, rng)
+        for codes, hand_rank in zip(batch, map(rank_codes, batch), strict=True):
+            if hand_rank == target and (
+                required_rank is None or any(code & RANK_BITS == required_rank for code in codes)
+            ):
+                return codes
+
+
+if __name__ == "__main__":
+    # Example usage: look for an ace-high or wheel straight for testing
+    deck_codes = [card.code for card in PokerCard.generate_deck()]
+    poker_hand = PokerHand.from_codes(sample_until(deck_codes, PokerHandRank.STRAIGHT, Rank.ACE))
+    print("Hand:", ", ".join(str(card) for card in poker_hand.cards))
+    print("Hand Rank:", poker_hand.rank.value)
+    print("Rank Cards:", ", ".join(str(card) for card in poker_hand.rank_cards))
+    print("Kickers:", ", ".join(str(card) for card in poker_hand.kickers))
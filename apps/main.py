@@ -1,57 +1,53 @@
 """Texas Hold'em Poker API using FastAPI."""
 
+from __future__ import annotations
+
 import asyncio
 import random
 import threading
 import time
-from contextlib import asynccontextmanager
+from collections.abc import Iterable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import combinations, combinations_with_replacement
 
-from fastapi import FastAPI, Header, HTTPException
-from pydantic import BaseModel, PrivateAttr
+from fastapi import FastAPI, Header, HTTPException, Response
+from pydantic import BaseModel
 
-# ruff: noqa: PLR2004, PLW0603, SLF001
+# ruff: noqa: PLR2004
 
 # python -m uvicorn apps.main:app --reload
 
 
 # ----- Session Management -----
-SESSIONS: dict[str, dict] = {}  # user_id -> {"game": GameState, "deck": list, "last_active": float}
+SESSIONS: dict[str, dict] = {}  # user_id -> {"game": GameStateCore, "last_active": float}
 SESSION_TTL_SECONDS = 3600
 _session_lock = threading.Lock()
 
 
-def _activate_session(user_id: str) -> None:
-    """Swap the user's game state into the global TEXAS_GAME."""
-    global TEXAS_GAME
+def _get_game(user_id: str) -> GameStateCore:
+    """Return the game state for a specific user."""
     with _session_lock:
         session = SESSIONS.get(user_id)
         if session is None:
             raise HTTPException(status_code=400, detail="No active round. Call /texas/single/start first.")
         session["last_active"] = time.time()
-        TEXAS_GAME = session["game"]
-        TEXAS_GAME._deck = session["deck"]
+        return session["game"]
 
 
-def _save_session(user_id: str) -> None:
-    """Save the current TEXAS_GAME state back to the user's session."""
-    with _session_lock:
-        if TEXAS_GAME is not None:
-            SESSIONS[user_id] = {
-                "game": TEXAS_GAME,
-                "deck": TEXAS_GAME._deck,
-                "last_active": time.time(),
-            }
+@contextmanager
+def _locked_game(user_id: str) -> Iterator[GameStateCore]:
+    """Fetch the user's game and hold its lock, so requests for one game run one at a time."""
+    game = _get_game(user_id)
+    with game.lock:
+        yield game
 
 
-def _create_session(user_id: str) -> None:
-    """Create a new session for the current TEXAS_GAME."""
+def _set_game(user_id: str, game: GameStateCore) -> None:
+    """Store the game state for a specific user."""
     with _session_lock:
-        if TEXAS_GAME is not None:
-            SESSIONS[user_id] = {
-                "game": TEXAS_GAME,
-                "deck": TEXAS_GAME._deck,
-                "last_active": time.time(),
-            }
+        SESSIONS[user_id] = {"game": game, "last_active": time.time()}
 
 
 def _cleanup_sessions() -> None:
@@ -110,7 +106,7 @@ class BetRequest(BaseModel):
 
 
 class GameState(BaseModel):
-    """Current game state."""
+    """Current game state, as returned by the API."""
 
     players_hands: dict[str, list[str]]
     community_cards: list[str]
@@ -131,145 +127,306 @@ class GameState(BaseModel):
     to_act: str | None = None  # "player" or "cpu"
     last_small_blind: str | None = None
 
-    # private deck (not serialized)
-    _deck: list[str] = PrivateAttr(default_factory=list[str])  # deck is kept server-side
 
+@dataclass(slots=True)
+class GameStateCore:
+    """Server-side game state; converted to GameState only when responding.
+
+    Cards are held as CARD_INT integers and formatted back to strings for the response.
+    """
+
+    hands: dict[str, list[int]]
+    board: list[int]
+    status: str  # preflop, flop, turn, river, showdown, finished
+    bet: int
+    winning_number: tuple[int, list[int]] | None = None
+    winners: list[str] | None = None
+
+    # single-player fields
+    mode: str | None = None  # None or "single"
+    cpu_players: list[str] | None = None
+    pot: int | None = None
+    current_bet: int | None = None
+    to_act: str | None = None  # "player" or "cpu"
+    last_small_blind: str | None = None
+
+    # per-seat state, indexed by turn order (seat 0 is "Player")
+    seats: list[str] = field(default_factory=list)
+    seat_of: dict[str, int] = field(default_factory=dict)
+    stacks: list[int] = field(default_factory=list)
+    bets: list[int] = field(default_factory=list)  # bets in the current betting round
+    active_mask: int = 0  # bit i set while seat i has not folded
+    actions: list[str | None] = field(default_factory=list)
+
+    deck: list[int] = field(default_factory=list)  # deck is kept server-side
+    deck_idx: int = 0  # next undealt card in deck
+    off_board: list[int] = field(default_factory=lambda: list(DECK52_INT))  # refreshed on each deal
+    preflop: dict[str, float] = field(default_factory=dict)  # hole-card strength, scored once per hand
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    # string and name-keyed views of the state for the API response
+    @property
+    def players_hands(self) -> dict[str, list[str]]:
+        return {p: [CARD_STR[c] for c in hand] for p, hand in self.hands.items()}
+
+    @property
+    def community_cards(self) -> list[str]:
+        return [CARD_STR[c] for c in self.board]
+
+    @property
+    def round_bets(self) -> dict[str, int]:
+        return dict(zip(self.seats, self.bets))
+
+    @property
+    def player_stacks(self) -> dict[str, int]:
+        return dict(zip(self.seats, self.stacks))
+
+    @property
+    def folded(self) -> list[str]:
+        return [p for i, p in enumerate(self.seats) if not self.active_mask >> i & 1]
+
+    @property
+    def last_action(self) -> dict[str, str]:
+        return {p: a for p, a in zip(self.seats, self.actions) if a is not None}
 
-# ----- In-memory game state -----
-TEXAS_GAME: GameState | None = None  # global singleton game state
 
 # ----- Card helpers -----
 SUITS = ["S", "H", "D", "C"]
 RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
 
-RANK_VALUE = {r: i + 2 for i, r in enumerate(RANKS)}  # '2'->2 ... 'A'->14
+# Cactus-Kev card integers: xxxbbbbb bbbbbbbb cdhsrrrr xxpppppp
+#   b = one bit per rank, cdhs = suit bit, r = rank index (0-12), p = rank prime
+RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+SUIT_BITS = {"S": 0x8000, "H": 0x4000, "D": 0x2000, "C": 0x1000}
+
+CARD_INT: dict[str, int] = {
+    f"{r}{s}": 1 << (16 + i) | SUIT_BITS[s] | i << 8 | RANK_PRIMES[i]
+    for s in SUITS
+    for i, r in enumerate(RANKS)
+}
+CARD_STR: dict[int, str] = {c: s for s, c in CARD_INT.items()}
+
+DECK52_INT: tuple[int, ...] = tuple(CARD_INT.values())  # unshuffled deck, built once
+_RNG = random.Random()  # long-lived generator used for shuffling
+
 
+def new_deck(seed: int | None = None) -> list[int]:
+    """Generate and return a new shuffled deck of CARD_INT cards.
 
-def new_deck() -> list[str]:
-    """Generate and return a new shuffled deck of cards."""
-    deck = [f"{r}{s}" for s in SUITS for r in RANKS]
-    random.shuffle(deck)
+    Pass a seed to get a reproducible deck, e.g. in tests.
+    """
+    deck = list(DECK52_INT)
+    (random.Random(seed) if seed is not None else _RNG).shuffle(deck)
     return deck
 
 
-def draw(deck: list[str]) -> str:
-    """Draw a card from the deck."""
-    if not deck:
+def draw(game: GameStateCore, n: int = 1) -> list[int]:
+    """Draw the next n cards from the game's deck by advancing its cursor."""
+    start = game.deck_idx
+    end = start + n
+    if end > len(game.deck):
         raise HTTPException(status_code=500, detail="Deck is empty.")
-    return deck.pop()
+    game.deck_idx = end
+    return game.deck[start:end]
 
 
-def parse_card(card: str) -> tuple[int, str]:
-    """Parse a card string into (rank_value, suit)."""
-    return RANK_VALUE[card[:-1]], card[-1]  # rank, suit
+# ----- Poker hand evaluator -----
+def _build_straight_high() -> list[int]:
+    """Map every 13-bit rank mask (bit i = rank i + 2) to its straight's high rank, or 0."""
+    table = [0] * (1 << 13)
+    for rank_mask in range(1 << 13):
+        mask = rank_mask << 1 | rank_mask >> 12  # bit r - 1 per rank, plus the ace as 1 for the wheel
+        # bit i survives only if ranks i+1 .. i+5 are all present
+        runs = mask & (mask >> 1) & (mask >> 2) & (mask >> 3) & (mask >> 4)
+        if runs:
+            table[rank_mask] = runs.bit_length() + 4  # low rank of the best run is bit_length()
+    return table
 
 
-# ----- Poker hand evaluator -----
-def _get_straight_high(ranks_set: set[int]) -> int | None:
-    """Return highest rank of straight in ranks_set, or None if no straight."""
-    # include ace as 1 for wheel
-    ranks = set(ranks_set)
-    if 14 in ranks:
-        ranks.add(1)
-    sorted_r = sorted(ranks)  # ascending sort for straight detection
-    consec = 1  # consecutive count
-    last = None
-    best_high = None
-    for r in sorted_r:  # for each rank in ascending order
-        if last is None or r != last + 1:  # if not consecutive
-            consec = 1  # reset count
-        else:  # consecutive
-            consec += 1  # increment count of consecutive ranks
-        if consec >= 5:  # found a straight
-            best_high = r  # update best high rank
-        last = r  # update last rank
-    return best_high
+STRAIGHT_HIGH = _build_straight_high()
 
 
-def evaluate_best_hand(cards: list[str]) -> tuple[int, list[int]]:
-    """Return a comparable tuple (rank_value, tie_breakers).
+def _get_straight_high(rank_mask: int) -> int | None:
+    """Return highest rank of straight in a 13-bit rank mask, or None if no straight."""
+    return STRAIGHT_HIGH[rank_mask] or None
 
-    rank_value: 10 = royal flush, 9 = straight flush, 8 = four, 7 = full house, 6 = flush,
-    5 = straight, 4 = three, 3 = two pair, 2 = one pair, 1 = high card
-    tie_breakers: list of ranks descending used for breaking ties
-    """
+
+def _score_flush(flush_ranks: list[int]) -> tuple[int, list[int]]:
+    """Score a flush given its ranks in descending order (straight flush aware)."""
+    sf_high = _get_straight_high(sum(1 << (r - 2) for r in flush_ranks))
+    if sf_high:
+        # royal flush (A-high straight flush)
+        if sf_high == 14:
+            return 10, [14]
+        return 9, [sf_high]
+    return 6, flush_ranks[:5]
+
+
+def _top_ranks(mask: int, k: int) -> list[int]:
+    """Return up to k highest ranks set in a rank mask (bit r - 2 per rank), descending."""
     ranks: list[int] = []
-    suits_map: dict[str, list[int]] = {s: [] for s in SUITS}  # suit -> list of ranks
-    for c in cards:  # for each card in hand
-        r, s = parse_card(c)  # rank, suit
-        ranks.append(r)
-        suits_map[s].append(r)
+    while mask and len(ranks) < k:
+        top = mask.bit_length()
+        ranks.append(top + 1)
+        mask ^= 1 << (top - 1)
+    return ranks
 
-    counts: dict[int, int] = {}
-    for r in ranks:
-        counts[r] = counts.get(r, 0) + 1
-
-    # sort unique ranks desc
-    unique_desc = sorted(set(ranks), reverse=True)
-
-    # Check for flush
-    flush_suit = None
-    flush_ranks: list[int] = []
-    for s, rs in suits_map.items():
-        if len(rs) >= 5:
-            flush_suit = s
-            flush_ranks = sorted(rs, reverse=True)
-            break
 
-    # Check for straight flush
-    if flush_suit is not None:
-        sf_high = _get_straight_high(set(flush_ranks))
-        if sf_high:
-            # royal flush (A-high straight flush)
-            if sf_high == 14:
-                return 10, [14]
-            return 9, [sf_high]
+def _score_ranks(ranks: list[int]) -> tuple[int, list[int]]:
+    """Score a hand from its ranks alone (every category except flushes)."""
+    ones = twos = threes = fours = 0  # bit r - 2 set for ranks seen at least 1, 2, 3, 4 times
+    for r in ranks:
+        b = 1 << (r - 2)
+        fours |= threes & b
+        threes |= twos & b
+        twos |= ones & b
+        ones |= b
 
     # Four of a kind
-    quads = [r for r, c in counts.items() if c == 4]
-    if quads:
-        q = max(quads)
-        kickers = [r for r in unique_desc if r != q]
-        return 8, [q, kickers[0]]
+    if fours:
+        quad = _top_ranks(fours, 1)[0]
+        return 8, [quad, *_top_ranks(ones & ~(1 << (quad - 2)), 1)]
 
     # Full house (three + pair)
-    trips = sorted([r for r, c in counts.items() if c >= 3], reverse=True)
-    pairs = sorted([r for r, c in counts.items() if c >= 2 and r not in trips], reverse=True)
-    if trips and (pairs or len(trips) >= 2):
-        three = trips[0]
-        pair = pairs[0] if pairs else trips[1]
-        return 7, [three, pair]
-
-    # Flush
-    if flush_suit is not None:
-        return 6, flush_ranks[:5]
+    trips = _top_ranks(threes, 2)
+    pairs = _top_ranks(twos & ~threes, 2)
+    if trips and (pairs or len(trips) > 1):
+        return 7, [trips[0], pairs[0] if pairs else trips[1]]
 
     # Straight
-    straight_high = _get_straight_high(set(ranks))
+    straight_high = _get_straight_high(ones)
     if straight_high:
         return 5, [straight_high]
 
     # Three of a kind
     if trips:
-        three = trips[0]
-        kickers = [r for r in unique_desc if r != three][:2]  # top 2 kickers
-        return 4, [three, *kickers]
+        return 4, [trips[0], *_top_ranks(ones & ~threes, 2)]  # top 2 kickers
 
     # Two pair
-    pair_ranks = sorted([r for r, c in counts.items() if c == 2], reverse=True)  # all pairs
-    if len(pair_ranks) >= 2:
-        top1, top2 = pair_ranks[0], pair_ranks[1]
-        kicker = next(r for r in unique_desc if r not in (top1, top2))  # top kicker
-        return 3, [top1, top2, kicker]
+    if len(pairs) > 1:
+        pair_bits = 1 << (pairs[0] - 2) | 1 << (pairs[1] - 2)
+        return 3, [*pairs, *_top_ranks(ones & ~pair_bits, 1)]  # top kicker
 
     # One pair
-    if len(pair_ranks) == 1:
-        pair = pair_ranks[0]
-        kickers = [r for r in unique_desc if r != pair][:3]  # top 3 kickers
-        return 2, [pair, *kickers]
+    if pairs:
+        return 2, [pairs[0], *_top_ranks(ones & ~twos, 3)]  # top 3 kickers
 
     # High card
-    return 1, unique_desc[:5]
+    return 1, _top_ranks(ones, 5)
+
+
+def _build_tables() -> tuple[list[int], dict[int, int], list[tuple[int, tuple[int, ...]]]]:
+    """Build the flush table (indexed by 13-bit rank mask) and the prime-product table.
+
+    Both cover every 0-7 card hand, so a 7-card hand is scored with a single lookup
+    instead of scoring its 21 five-card subsets. The tables hold a hand rank: the index
+    of the hand's score in the sorted list of all distinct scores, also returned, so
+    stronger hands have larger ranks and hands compare with a single int comparison.
+    Scores hold their tie-breakers as tuples, so the shared table can't be mutated.
+    """
+    flush_scores: dict[int, tuple[int, list[int]]] = {}
+    for n in range(5, 8):
+        for idx in combinations(range(12, -1, -1), n):
+            mask = 0
+            for i in idx:
+                mask |= 1 << i
+            flush_scores[mask] = _score_flush([i + 2 for i in idx])
+
+    unique_scores: dict[int, tuple[int, list[int]]] = {}
+    for n in range(8):
+        for idx in combinations_with_replacement(range(13), n):
+            if any(idx[i] == idx[i + 4] for i in range(n - 4)):
+                continue  # five of a rank cannot be dealt from one deck
+            product = 1
+            for i in idx:
+                product *= RANK_PRIMES[i]
+            unique_scores[product] = _score_ranks([i + 2 for i in idx])
+
+    scores = sorted({(cat, tuple(tb)) for cat, tb in [*flush_scores.values(), *unique_scores.values()]})
+    rank_of = {key: rank for rank, key in enumerate(scores)}
+
+    flushes = [0] * (1 << 13)  # masks with fewer than 5 ranks are never looked up
+    for mask, (cat, tb) in flush_scores.items():
+        flushes[mask] = rank_of[cat, tuple(tb)]
+    unique = {product: rank_of[cat, tuple(tb)] for product, (cat, tb) in unique_scores.items()}
+    return flushes, unique, scores
+
+
+FLUSH_TABLE, UNIQUE_TABLE, HAND_SCORES = _build_tables()
+
+
+# Suit counts are packed as 4-bit counters at bit 4 * suit_bit_value (4, 8, 16, 32); adding
+# 3 to every counter sets its top bit exactly when that suit has 5 or more cards.
+_FLUSH_ADD = sum(3 << (4 * v) for v in (1, 2, 4, 8))
+_FLUSH_TEST = sum(8 << (4 * v) for v in (1, 2, 4, 8))
+
+
+def _hand_rank(ints: Iterable[int]) -> int:
+    """Rank a hand given as CARD_INT integers; HAND_SCORES[rank] is its score tuple."""
+    product = 1
+    suit_counts = 0
+    for c in ints:
+        product *= c & 0xFF
+        suit_counts += 1 << (c >> 10 & 0x3C)
+
+    # A flush in seven cards rules out quads and full houses, so it always wins
+    flush = (suit_counts + _FLUSH_ADD) & _FLUSH_TEST
+    if flush:
+        suit = (flush.bit_length() - 4) >> 2 << 12
+        mask = 0
+        for c in ints:
+            if c & suit:
+                mask |= c
+        return FLUSH_TABLE[mask >> 16]
+    return UNIQUE_TABLE[product]
+
+
+def evaluate_best_hand(cards: list[str]) -> tuple[int, list[int]]:
+    """Return a comparable tuple (rank_value, tie_breakers).
+
+    rank_value: 10 = royal flush, 9 = straight flush, 8 = four, 7 = full house, 6 = flush,
+    5 = straight, 4 = three, 3 = two pair, 2 = one pair, 1 = high card
+    tie_breakers: list of ranks descending used for breaking ties
+    """
+    cat, tb = HAND_SCORES[_eval_cached(frozenset([CARD_INT[c] for c in cards]))]
+    return cat, list(tb)  # a fresh list, so callers can't alter the shared table
+
+
+def evaluate_best_hands_batch(hands: list[list[int]]) -> list[int]:
+    """Rank many hands of CARD_INT integers at once, e.g. Monte Carlo runouts.
+
+    Same ranking as _hand_rank, inlined with the tables bound to locals so the
+    per-hand cost is the card loop alone rather than a call plus global lookups.
+    """
+    flush_table = FLUSH_TABLE
+    unique_table = UNIQUE_TABLE
+    flush_add = _FLUSH_ADD
+    flush_test = _FLUSH_TEST
+    ranks: list[int] = []
+    append = ranks.append
+    for ints in hands:
+        product = 1
+        suit_counts = 0
+        for c in ints:
+            product *= c & 0xFF
+            suit_counts += 1 << (c >> 10 & 0x3C)
+        flush = (suit_counts + flush_add) & flush_test
+        if flush:
+            suit = (flush.bit_length() - 4) >> 2 << 12
+            mask = 0
+            for c in ints:
+                if c & suit:
+                    mask |= c
+            append(flush_table[mask >> 16])
+        else:
+            append(unique_table[product])
+    return ranks
+
+
+@lru_cache(maxsize=1 << 16)
+def _eval_cached(cards: frozenset[int]) -> int:
+    """Rank a set of CARD_INT cards, memoized across CPU decisions and showdown."""
+    return _hand_rank(cards)
 
 
 def compare_hands(cards_a: list[str], cards_b: list[str]) -> int:
@@ -283,7 +440,7 @@ def compare_hands(cards_a: list[str], cards_b: list[str]) -> int:
     return 0
 
 
-def _preflop_strength(hand: list[str]) -> float:
+def _preflop_score(high_rank: int, low_rank: int, is_suited: bool) -> float:
     """Calculate preflop hand strength using standard poker hand rankings.
 
     Returns a score 0.0-10.0 based on:
@@ -292,14 +449,9 @@ def _preflop_strength(hand: list[str]) -> float:
     - Suited connectors (high: AKs-KQs=8.5, medium: QJs-99s=6.5, low: 88s-22s=4.5)
     - Other hands scaled accordingly
     """
-    r1, s1 = parse_card(hand[0])
-    r2, s2 = parse_card(hand[1])
-    is_pair = r1 == r2
-    is_suited = s1 == s2
-    is_connected = abs(r1 - r2) == 1
-    is_one_gap = abs(r1 - r2) == 2
-    high_rank = max(r1, r2)
-    low_rank = min(r1, r2)
+    is_pair = high_rank == low_rank
+    is_connected = high_rank - low_rank == 1
+    is_one_gap = high_rank - low_rank == 2
 
     # Pocket pairs
     if is_pair:
@@ -366,234 +518,243 @@ def _preflop_strength(hand: list[str]) -> float:
     return 2.0 if high_rank >= 10 else 1.0
 
 
+# (high_rank, low_rank, is_suited) -> score for all 169 starting hands
+PREFLOP_TABLE: dict[tuple[int, int, bool], float] = {
+    (high, low, suited): _preflop_score(high, low, suited)
+    for high in range(2, 15)
+    for low in range(2, high + 1)
+    for suited in ((False, True) if low < high else (False,))  # a pair can't be suited
+}
+
+
+def _preflop_strength(hand: list[int]) -> float:
+    """Return the preflop strength (0.0-10.0) of two CARD_INT hole cards from PREFLOP_TABLE."""
+    c1, c2 = hand
+    r1 = (c1 >> 8 & 0xF) + 2
+    r2 = (c2 >> 8 & 0xF) + 2
+    return PREFLOP_TABLE[max(r1, r2), min(r1, r2), bool(c1 & c2 & 0xF000)]
+
+
 # ----- Game logic -----
-def state() -> GameState:
-    """Return current game state."""
-    if TEXAS_GAME is None:
-        raise HTTPException(
-            status_code=400,
-            detail="No active round. Call /texas/single/start first.",
-        )
-    return TEXAS_GAME
+def _response(game: GameStateCore) -> Response:
+    """Serialize the current game state as the JSON body of a GameState response.
+
+    The state is built server-side, so the model is constructed without validation and
+    written straight to JSON by pydantic-core instead of FastAPI's jsonable_encoder.
+    """
+    model = GameState.model_construct(**{name: getattr(game, name) for name in GameState.model_fields})
+    return Response(model.model_dump_json(), media_type="application/json")
 
 
-def _ensure_single() -> GameState:
+def _ensure_single(game: GameStateCore) -> None:
     """Ensure a single-player game is active."""
-    s = state()
-    if s.mode != "single":
+    if game.mode != "single":
         raise HTTPException(status_code=400, detail="No active single-player round.")
-    return s
 
 
-def _active_players() -> list[str]:
+def _active_players(game: GameStateCore) -> list[str]:
     """Return active (not folded) players in the current hand."""
-    if TEXAS_GAME is None:
-        return []
-    folded = set(TEXAS_GAME.folded or [])
-    return [p for p in TEXAS_GAME.players_hands if p not in folded]
-
-
-def _post_bet(player: str, amount: int) -> None:
-    """Post a bet and update stacks/pot/current bet."""
-    if TEXAS_GAME is None:
-        raise HTTPException(status_code=400, detail="No active round.")
-    if TEXAS_GAME.player_stacks is None or TEXAS_GAME.round_bets is None:
-        raise HTTPException(status_code=500, detail="Single-player state not initialized.")
-    if amount <= 0:
-        raise HTTPException(status_code=400, detail="Bet amount must be > 0")
-    if TEXAS_GAME.player_stacks[player] < amount:
-        raise HTTPException(status_code=400, detail="Insufficient stack.")
-    TEXAS_GAME.player_stacks[player] -= amount
-    TEXAS_GAME.round_bets[player] += amount
-    TEXAS_GAME.pot = (TEXAS_GAME.pot or 0) + amount
-    TEXAS_GAME.current_bet = max(TEXAS_GAME.current_bet or 0, TEXAS_GAME.round_bets[player])
+    mask = game.active_mask
+    return [p for i, p in enumerate(game.seats) if mask >> i & 1]
 
 
-def _call_or_check(player: str) -> int:
+def _call_or_check(game: GameStateCore, player: str) -> int:
     """Call up to current bet or check if nothing to call."""
-    if TEXAS_GAME is None:
-        raise HTTPException(status_code=400, detail="No active round.")
-    if TEXAS_GAME.player_stacks is None or TEXAS_GAME.round_bets is None:
+    if not game.seats:
         raise HTTPException(status_code=500, detail="Single-player state not initialized.")
-    to_call = (TEXAS_GAME.current_bet or 0) - TEXAS_GAME.round_bets[player]
+    seat = game.seat_of[player]
+    to_call = (game.current_bet or 0) - game.bets[seat]
     if to_call <= 0:
         return 0
-    call_amt = min(to_call, TEXAS_GAME.player_stacks[player])
-    TEXAS_GAME.player_stacks[player] -= call_amt
-    TEXAS_GAME.round_bets[player] += call_amt
-    TEXAS_GAME.pot = (TEXAS_GAME.pot or 0) + call_amt
+    call_amt = min(to_call, game.stacks[seat])
+    game.stacks[seat] -= call_amt
+    game.bets[seat] += call_amt
+    game.pot = (game.pot or 0) + call_amt
     return call_amt
 
 
-def _round_settled() -> bool:
+def _call_and_raise(game: GameStateCore, player: str, amount: int) -> None:
+    """Call up to the current bet, then raise by amount, updating stacks/pot once."""
+    if not game.seats:
+        raise HTTPException(status_code=500, detail="Single-player state not initialized.")
+    seat = game.seat_of[player]
+    to_call = (game.current_bet or 0) - game.bets[seat]
+    call_amt = min(to_call, game.stacks[seat]) if to_call > 0 else 0
+    amount = max(0, amount)
+    if game.stacks[seat] - call_amt < amount:
+        _call_or_check(game, player)  # the call still stands, only the raise is refused
+        raise HTTPException(status_code=400, detail="Insufficient stack.")
+    total = call_amt + amount
+    game.stacks[seat] -= total
+    game.bets[seat] += total
+    game.pot = (game.pot or 0) + total
+    if amount:
+        game.current_bet = max(game.current_bet or 0, game.bets[seat])
+
+
+def _round_settled(game: GameStateCore) -> bool:
     """Check if all active players have matched the current bet."""
-    if TEXAS_GAME is None:
-        return False
-    if TEXAS_GAME.round_bets is None or TEXAS_GAME.current_bet is None:
+    if not game.seats or game.current_bet is None:
         return False
-    active_players = _active_players()
-    if not active_players:
-        return True
-    for player in active_players:
-        player_stack = (TEXAS_GAME.player_stacks or {}).get(player, 0)
-        if player_stack == 0:
-            continue
-        if TEXAS_GAME.round_bets.get(player, 0) != (TEXAS_GAME.current_bet or 0):
+    current_bet = game.current_bet
+    stacks = game.stacks
+    bets = game.bets
+    mask = game.active_mask
+    while mask:  # visit each active seat's bit, lowest first
+        seat = (mask & -mask).bit_length() - 1
+        mask &= mask - 1
+        if stacks[seat] and bets[seat] != current_bet:  # all-in players have nothing to match
             return False
     return True
 
 
-def _advance_stage() -> None:
+def _advance_stage(game: GameStateCore) -> None:
     """Advance the hand stage and reset round betting state."""
-    if TEXAS_GAME is None:
-        raise HTTPException(status_code=400, detail="No active round.")
-    if TEXAS_GAME.status == "preflop":
-        _deal_community(3)
-        TEXAS_GAME.status = "flop"
-    elif TEXAS_GAME.status == "flop":
-        _deal_community(1)
-        TEXAS_GAME.status = "turn"
-    elif TEXAS_GAME.status == "turn":
-        _deal_community(1)
-        TEXAS_GAME.status = "river"
-    elif TEXAS_GAME.status == "river":
-        TEXAS_GAME.status = "showdown"
-    if TEXAS_GAME.round_bets is not None:
-        for player in TEXAS_GAME.round_bets:
-            TEXAS_GAME.round_bets[player] = 0
-    TEXAS_GAME.current_bet = 0
-    TEXAS_GAME.to_act = "player"
-
-
-def _settle_showdown() -> None:
+    if game.status == "preflop":
+        _deal_community(game, 3)
+        game.status = "flop"
+    elif game.status == "flop":
+        _deal_community(game, 1)
+        game.status = "turn"
+    elif game.status == "turn":
+        _deal_community(game, 1)
+        game.status = "river"
+    elif game.status == "river":
+        game.status = "showdown"
+    game.bets = [0] * len(game.seats)
+    game.current_bet = 0
+    game.to_act = "player"
+
+
+def _distribute_pot(game: GameStateCore, winners: list[str]) -> None:
+    """Split the pot evenly among winners; the first winners get the odd chips."""
+    if not winners:
+        return
+    split, remainder = divmod(game.pot or 0, len(winners))
+    for p, extra in zip(winners, [1] * remainder + [0] * (len(winners) - remainder)):
+        game.stacks[game.seat_of[p]] += split + extra
+
+
+def _settle_showdown(game: GameStateCore) -> None:
     """Compute winners, split pot, and finalize the hand."""
-    if TEXAS_GAME is None:
-        raise HTTPException(status_code=400, detail="No active round.")
-    community = TEXAS_GAME.community_cards
-    scores: dict[str, tuple[int, list[int]]] = {}
-    for player, hand in TEXAS_GAME.players_hands.items():
-        if TEXAS_GAME.folded and player in TEXAS_GAME.folded:
-            continue
-        scores[player] = evaluate_best_hand(hand + community)  # score for each player
-    best_players: list[str] = []
-    best_score: tuple[int, list[int]] | None = None
-    for p, sc in scores.items():
-        if best_score is None or sc > best_score:  # found new best score
-            best_score = sc
-            best_players = [p]  # new winner list
-        elif sc == best_score:  # tie for best score
-            best_players.append(p)  # add to winners
-    TEXAS_GAME.winners = best_players
-    TEXAS_GAME.winning_number = best_score
-    if TEXAS_GAME.player_stacks is not None:
-        pot = TEXAS_GAME.pot or 0
-        if best_players:
-            split = pot // len(best_players)  # integer division for split pot
-            remainder = pot % len(best_players)  # remainder to first winners
-            for i, p in enumerate(best_players):
-                TEXAS_GAME.player_stacks[p] += split + (1 if i < remainder else 0)  # split pot
-    TEXAS_GAME.status = "finished"
-
-
-def _calculate_pot_odds(to_call: int) -> float:
+    players = _active_players(game)
+    if not players:  # nobody left to score
+        game.winners = players
+        game.status = "finished"
+        return
+    community = game.board
+    ranks = evaluate_best_hands_batch([game.hands[p] + community for p in players])  # one batch
+    best_rank = max(ranks)
+    best_players = [p for p, rank in zip(players, ranks) if rank == best_rank]  # ties share
+    game.winners = best_players
+    cat, tb = HAND_SCORES[best_rank]
+    game.winning_number = (cat, list(tb))
+    _distribute_pot(game, best_players)
+    game.status = "finished"
+
+
+EQUITY_SAMPLES = 300  # Monte Carlo runouts per CPU decision on the flop and turn
+RIVER_EQUITY_SAMPLES = 200  # on the river only the opponent's hole cards are unknown
+
+
+def _calculate_pot_odds(game: GameStateCore, to_call: int) -> float:
     """Calculate pot odds ratio (0.0 to 1.0+).
 
     Returns the ratio: amount_to_call / (pot + amount_to_call)
     Lower ratio = better pot odds (should call more often)
     """
-    if TEXAS_GAME is None or to_call <= 0:
+    if to_call <= 0:
         return 0.0
-    total_pot = TEXAS_GAME.pot or 0
+    total_pot = game.pot or 0
     return to_call / (total_pot + to_call)
 
 
-def _get_opponent_count() -> int:
+def _get_opponent_count(game: GameStateCore) -> int:
     """Count active opponent players."""
-    if TEXAS_GAME is None:
-        return 0
-    active = _active_players()
-    return max(0, len(active) - 1)  # exclude self
+    return max(0, game.active_mask.bit_count() - 1)  # exclude self
 
 
-def _get_hand_potential(hand: list[str], community: list[str]) -> float:
-    """Estimate hand's potential to improve.
+def _get_hand_potential(
+    hand: list[int], community: list[int], off_board: list[int], seed: int | None = None
+) -> float:
+    """Estimate the hand's equity against one random opponent by Monte Carlo.
 
-    Returns 0.0-1.0 representing likelihood of making strong hand.
-    Considers current hand rank and remaining cards.
+    Takes CARD_INT integers; off_board is every card not in community. Deals EQUITY_SAMPLES
+    random runouts of the board plus two opponent hole cards (RIVER_EQUITY_SAMPLES once the
+    board is complete) and returns wins + half of ties as a fraction (0.0-1.0).
+    Pass a seed for a reproducible estimate, e.g. in tests.
     """
     if not hand or len(hand) != 2:
         return 0.0
 
-    current_strength = evaluate_best_hand(hand + community)[0]
-
-    # Already strong hands have less upside
-    if current_strength >= 8:  # Four of a kind or better
-        return 0.1
-    if current_strength >= 6:  # Flush or better
-        return 0.3
-    if current_strength >= 5:  # Straight or better
-        return 0.4
-
-    # Check for draws (potential to improve)
-    r1, s1 = parse_card(hand[0])
-    r2, s2 = parse_card(hand[1])
-    community_ranks = [parse_card(c)[0] for c in community]
-    hand_ranks = [r1, r2]
-
-    potential = 0.0
-
-    # Flush draw (4 cards same suit)
-    if s1 == s2:
-        suit_count = sum(1 for c in community if parse_card(c)[1] == s1)
-        if suit_count >= 2:  # 4 cards to flush
-            potential += 0.5
-
-    # Straight draw (4 to straight) or open-ended
-    all_ranks = hand_ranks + community_ranks
-    gaps = [all_ranks[i + 1] - all_ranks[i] - 1 for i in range(len(all_ranks) - 1)]
-    if gaps.count(1) >= 2 or (abs(r1 - r2) <= 3):  # open-ended or inside
-        potential += 0.4
-
-    # Overcards (both hole cards are higher than community)
-    if community and all(r > max(community_ranks) for r in hand_ranks):
-        potential += 0.3
-
-    return min(1.0, potential)
-
-
-def _cpu_decide_action(cpu_name: str) -> tuple[str, int]:
+    remaining = [c for c in off_board if c not in hand]
+    needed = 2 + 5 - len(community)  # opponent's hole cards + rest of the board
+    samples = EQUITY_SAMPLES if needed > 2 else RIVER_EQUITY_SAMPLES
+    sample = (random.Random(seed) if seed is not None else _RNG).sample
+    k = len(community)
+    h1, h2 = hand
+    mine: list[list[int]] = []
+    theirs: list[list[int]] = []
+    for _ in range(samples):
+        dealt = sample(remaining, needed)  # opponent's hole cards first, then the runout
+        theirs.append(community + dealt)
+        cards = community + dealt  # same seven slots with our hole cards swapped in
+        cards[k] = h1
+        cards[k + 1] = h2
+        mine.append(cards)
+
+    wins = ties = 0
+    for a, b in zip(evaluate_best_hands_batch(mine), evaluate_best_hands_batch(theirs)):
+        if a > b:
+            wins += 1
+        elif a == b:
+            ties += 1
+    return (wins + ties / 2) / samples
+
+
+def _cpu_decide_action(game: GameStateCore, cpu_name: str) -> tuple[str, int]:
     """Decide CPU action using comprehensive hand analysis.
 
     Considers: hand strength, pot odds, stack sizes, opponents, and position.
     Returns (action, raise_amount) where action is 'stay', 'raise', or 'fold'.
     """
-    if TEXAS_GAME is None:
-        raise HTTPException(status_code=400, detail="No active round.")
 
-    cpu_hand = TEXAS_GAME.players_hands.get(cpu_name, [])
-    to_call = (TEXAS_GAME.current_bet or 0) - (TEXAS_GAME.round_bets or {}).get(cpu_name, 0)
-    cpu_stack = (TEXAS_GAME.player_stacks or {}).get(cpu_name, 0)
-    pot = TEXAS_GAME.pot or 0
-    community = TEXAS_GAME.community_cards
+    seat = game.seat_of[cpu_name]
+    cpu_hand = game.hands.get(cpu_name, [])
+    to_call = (game.current_bet or 0) - game.bets[seat]
+    cpu_stack = game.stacks[seat]
+    pot = game.pot or 0
+    community = game.board
 
     # Step 1: Evaluate hand strength
-    if TEXAS_GAME.status == "preflop":
-        hand_strength = _preflop_strength(cpu_hand) / 10.0  # normalize to 0.0-1.0
+    if game.status == "preflop":
+        hand_strength = game.preflop[cpu_name] / 10.0  # normalize to 0.0-1.0
     else:
-        hand_strength = evaluate_best_hand(cpu_hand + community)[0] / 10.0
+        hand_strength = HAND_SCORES[_eval_cached(frozenset(cpu_hand + community))][0] / 10.0
 
     # Step 2: Calculate additional factors
-    pot_odds = _calculate_pot_odds(to_call)
-    opponent_count = _get_opponent_count()
-    hand_potential = _get_hand_potential(cpu_hand, community)
-
-    # Adjust hand strength by position if late stage
-    if TEXAS_GAME.status in ("turn", "river"):
-        # Already mostly known, potential less important
-        adjusted_strength = hand_strength * 0.9 + hand_potential * 0.1
+    pot_odds = _calculate_pot_odds(game, to_call)
+    opponent_count = _get_opponent_count(game)
+
+    if game.status == "preflop":
+        # The preflop table already rates the hole cards, so skip the equity simulation;
+        # the 0.75 scale keeps fold/call/raise rates close to the old 0.6/0.4 blend
+        equity = None
+        adjusted_strength = hand_strength * 0.75
     else:
-        # Early stages, potential matters more
-        adjusted_strength = hand_strength * 0.6 + hand_potential * 0.4
+        equity = _get_hand_potential(cpu_hand, community, game.off_board)
+        # Equity against one random hand averages about 0.5, while the thresholds below
+        # were tuned for a potential averaging about 0.2, so the blend only counts the
+        # edge over a coin flip: 2 * equity - 1, floored at 0
+        hand_potential = max(0.0, 2 * equity - 1)
+
+        # Adjust hand strength by position if late stage
+        if game.status in ("turn", "river"):
+            # Already mostly known, potential less important
+            adjusted_strength = hand_strength * 0.9 + hand_potential * 0.1
+        else:
+            # Early stages, potential matters more
+            adjusted_strength = hand_strength * 0.6 + hand_potential * 0.4
 
     # Step 3: Determine action based on comprehensive strategy
     action = "fold"
@@ -637,8 +798,10 @@ def _cpu_decide_action(cpu_name: str) -> tuple[str, int]:
 
         # Medium hand - consider pot odds and implied odds
         elif adjusted_strength >= 0.35:
-            # Call if good pot odds or high potential
-            action = "stay" if pot_odds <= pot_odds_threshold or hand_potential >= 0.6 else "fold"
+            # Call if good pot odds, or if equity beats the price; equity against several
+            # opponents is roughly the chance of beating each of them in turn
+            beats_price = equity is not None and equity ** max(1, opponent_count) > pot_odds
+            action = "stay" if pot_odds <= pot_odds_threshold or beats_price else "fold"
 
         # Weak hand - fold unless very good odds or short stacks
         # Desperate situations (low stack) might push with weak hand
@@ -656,72 +819,55 @@ def _cpu_decide_action(cpu_name: str) -> tuple[str, int]:
     return action, amount
 
 
-def _finish_on_fold(folding_player: str) -> None:
+def _finish_on_fold(game: GameStateCore, folding_player: str) -> None:
     """End the hand immediately when a player folds."""
-    if TEXAS_GAME is None:
-        raise HTTPException(status_code=400, detail="No active round.")
-    if TEXAS_GAME.folded is None:
-        TEXAS_GAME.folded = []
-    if folding_player not in TEXAS_GAME.folded:
-        TEXAS_GAME.folded.append(folding_player)
-    remaining = _active_players()
-    if folding_player == "Player" or len(remaining) <= 1:
-        TEXAS_GAME.winners = remaining
-        if TEXAS_GAME.player_stacks is not None and remaining:
-            pot = TEXAS_GAME.pot or 0
-            split = pot // len(remaining)
-            remainder = pot % len(remaining)
-            for i, p in enumerate(remaining):
-                TEXAS_GAME.player_stacks[p] += split + (1 if i < remainder else 0)
-        TEXAS_GAME.status = "finished"
-
-
-def _cpu_take_turns() -> None:
+    game.active_mask &= ~(1 << game.seat_of[folding_player])
+    if folding_player == "Player" or game.active_mask.bit_count() <= 1:
+        game.winners = _active_players(game)
+        _distribute_pot(game, game.winners)
+        game.status = "finished"
+
+
+def _cpu_take_turns(game: GameStateCore) -> None:
     """Execute CPU actions in order and return control to player."""
-    if TEXAS_GAME is None:
-        raise HTTPException(status_code=400, detail="No active round.")
-    cpu_players = TEXAS_GAME.cpu_players or []
-    for cpu_name in cpu_players:
-        if TEXAS_GAME.folded and cpu_name in TEXAS_GAME.folded:
+    # these are only mutated in place, so local names stay valid across the loop
+    seat_of = game.seat_of
+    actions = game.actions
+    for cpu_name in game.cpu_players or []:
+        seat = seat_of[cpu_name]
+        if not game.active_mask >> seat & 1:  # folded
             continue
-        if TEXAS_GAME.status == "finished":
+        if game.status == "finished":
             return
-        action, amount = _cpu_decide_action(cpu_name)
-        if TEXAS_GAME.last_action is None:
-            TEXAS_GAME.last_action = {}
-        TEXAS_GAME.last_action[cpu_name] = action
+        action, amount = _cpu_decide_action(game, cpu_name)
+        actions[seat] = action
         if action == "fold":
-            _finish_on_fold(cpu_name)
-            if TEXAS_GAME.status == "finished":
+            _finish_on_fold(game, cpu_name)
+            if game.status == "finished":
                 return
             continue
         if action == "stay":
-            _call_or_check(cpu_name)
+            _call_or_check(game, cpu_name)
         elif action == "raise":
-            _call_or_check(cpu_name)
-            if amount > 0:
-                _post_bet(cpu_name, amount)
-    TEXAS_GAME.to_act = "player"
+            _call_and_raise(game, cpu_name, amount)
+    game.to_act = "player"
 
 
-def _maybe_progress_round() -> None:
+def _maybe_progress_round(game: GameStateCore) -> None:
     """Advance stages or settle showdown when bets are matched."""
-    if TEXAS_GAME is None:
-        raise HTTPException(status_code=400, detail="No active round.")
-    if TEXAS_GAME.status in ("finished", "showdown"):
-        if TEXAS_GAME.status == "showdown":
-            _settle_showdown()
+    if game.status in ("finished", "showdown"):
+        if game.status == "showdown":
+            _settle_showdown(game)
         return
-    if len(_active_players()) <= 1:
-        TEXAS_GAME.winners = _active_players()
-        if TEXAS_GAME.player_stacks is not None and TEXAS_GAME.winners:
-            TEXAS_GAME.player_stacks[TEXAS_GAME.winners[0]] += TEXAS_GAME.pot or 0
-        TEXAS_GAME.status = "finished"
+    if game.active_mask.bit_count() <= 1:
+        game.winners = _active_players(game)
+        _distribute_pot(game, game.winners)
+        game.status = "finished"
         return
-    if _round_settled():
-        _advance_stage()
-        if TEXAS_GAME.status == "showdown":
-            _settle_showdown()
+    if _round_settled(game):
+        _advance_stage(game)
+        if game.status == "showdown":
+            _settle_showdown(game)
 
 
 # ----- Endpoints -----
@@ -731,10 +877,9 @@ def root() -> dict[str, str]:
     return {"message": "Texas Hold'em API is running"}
 
 
-@app.post("/texas/single/start")
-def single_start(req: SingleStartRequest, x_user_id: str = Header(...)) -> GameState:
+@app.post("/texas/single/start", response_model=GameState)
+def single_start(req: SingleStartRequest, x_user_id: str = Header(...)) -> Response:
     """Start a new single-player Texas Hold'em game."""
-    global TEXAS_GAME
     if req.bet <= 0:
         raise HTTPException(status_code=400, detail="Blind must be > 0")
     if req.player_bankroll <= 0 or req.cpu_bankroll <= 0:
@@ -745,236 +890,161 @@ def single_start(req: SingleStartRequest, x_user_id: str = Header(...)) -> GameS
     deck = new_deck()
     cpu_players = [f"CPU{i + 1}" for i in range(req.cpu_players)]
     turn_order = ["Player", *cpu_players]
-    players_hands: dict[str, list[str]] = {"Player": [draw(deck), draw(deck)]}
-    for cpu_name in cpu_players:
-        players_hands[cpu_name] = [draw(deck), draw(deck)]
+    hands = {name: deck[2 * i : 2 * i + 2] for i, name in enumerate(turn_order)}  # top of the deck
 
-    round_bets = {"Player": 0}
-    player_stacks = {"Player": req.player_bankroll}
-    for cpu_name in cpu_players:
-        round_bets[cpu_name] = 0
-        player_stacks[cpu_name] = req.cpu_bankroll
+    bets = [0] * len(turn_order)
+    stacks = [req.player_bankroll] + [req.cpu_bankroll] * len(cpu_players)
 
     small_blind = max(1, req.bet // 2)
     big_blind = req.bet
-    small_blind_player = turn_order[0]
-    big_blind_player = turn_order[1 % len(turn_order)]
+    small_blind_seat = 0
+    big_blind_seat = 1 % len(turn_order)
 
-    if player_stacks[small_blind_player] < small_blind:
+    if stacks[small_blind_seat] < small_blind:
         raise HTTPException(status_code=400, detail="Small blind stack too low")
-    if player_stacks[big_blind_player] < big_blind:
+    if stacks[big_blind_seat] < big_blind:
         raise HTTPException(status_code=400, detail="Big blind stack too low")
 
     pot = 0
-    player_stacks[small_blind_player] -= small_blind
-    round_bets[small_blind_player] += small_blind
+    stacks[small_blind_seat] -= small_blind
+    bets[small_blind_seat] += small_blind
     pot += small_blind
-    player_stacks[big_blind_player] -= big_blind
-    round_bets[big_blind_player] += big_blind
+    stacks[big_blind_seat] -= big_blind
+    bets[big_blind_seat] += big_blind
     pot += big_blind
 
-    TEXAS_GAME = GameState(
-        players_hands=players_hands,
-        community_cards=[],
+    game = GameStateCore(
+        hands=hands,
+        board=[],
         bet=req.bet,
         status="preflop",
         mode="single",
         cpu_players=cpu_players,
         pot=pot,
         current_bet=big_blind,
-        round_bets=round_bets,
-        player_stacks=player_stacks,
-        folded=[],
-        last_action={},
         to_act="player",
-        last_small_blind=small_blind_player,
+        last_small_blind=turn_order[small_blind_seat],
+        seats=turn_order,
+        seat_of={name: seat for seat, name in enumerate(turn_order)},
+        stacks=stacks,
+        bets=bets,
+        active_mask=(1 << len(turn_order)) - 1,
+        actions=[None] * len(turn_order),
+        deck=deck,
+        deck_idx=2 * len(turn_order),
+        preflop={name: _preflop_strength(hand) for name, hand in hands.items() if name != "Player"},
     )
-    TEXAS_GAME._deck = deck
 
     # Check actions for CPUs 2 through 4
     for i in range(1, min(4, len(cpu_players))):
         cpu_name = cpu_players[i]
-        if TEXAS_GAME.status == "finished":
+        if game.status == "finished":
             break
-        action, amount = _cpu_decide_action(cpu_name)
-        if TEXAS_GAME.last_action is None:
-            TEXAS_GAME.last_action = {}
-        TEXAS_GAME.last_action[cpu_name] = action
+        action, amount = _cpu_decide_action(game, cpu_name)
+        game.actions[game.seat_of[cpu_name]] = action
         if action == "fold":
-            _finish_on_fold(cpu_name)
+            _finish_on_fold(game, cpu_name)
             continue
         if action == "stay":
-            _call_or_check(cpu_name)
+            _call_or_check(game, cpu_name)
         elif action == "raise":
-            _call_or_check(cpu_name)
-            if amount > 0:
-                _post_bet(cpu_name, amount)
-    TEXAS_GAME.to_act = "player"  # ensure player gets first action after blinds
-    _create_session(x_user_id)
+            _call_and_raise(game, cpu_name, amount)
+    game.to_act = "player"  # ensure player gets first action after blinds
+    _set_game(x_user_id, game)
 
-    return state()
+    return _response(game)
 
 
-@app.post("/texas/single/action")
-def single_action(req: ActionRequest, x_user_id: str = Header(...)) -> GameState:
+@app.post("/texas/single/action", response_model=GameState)
+def single_action(req: ActionRequest, x_user_id: str = Header(...)) -> Response:
     """Player action: stay (check/call), raise, or fold."""
-    _activate_session(x_user_id)
-    s = _ensure_single()
-    if s.to_act != "player":
-        raise HTTPException(status_code=400, detail="Not player's turn.")
-    if s.status not in ("preflop", "flop", "turn", "river"):
-        raise HTTPException(status_code=400, detail=f"Invalid state: {s.status}")
-
-    action = req.action.lower()
-    if action not in ("stay", "raise", "fold"):
-        raise HTTPException(status_code=400, detail="Invalid action.")
-
-    if s.last_action is None:
-        s.last_action = {}
-    s.last_action["Player"] = action
-
-    if action == "fold":
-        _finish_on_fold("Player")
-        _save_session(x_user_id)
-        return state()
-
-    if action == "stay":
-        _call_or_check("Player")
-    elif action == "raise":
-        if not req.amount or req.amount <= 0:
-            raise HTTPException(status_code=400, detail="Raise amount must be > 0")
-        _call_or_check("Player")
-        _post_bet("Player", req.amount)
-
-    s.to_act = "cpu"
-    _cpu_take_turns()
-    if s.status != "finished" and s.to_act == "player" and _round_settled():
-        _maybe_progress_round()
-    _save_session(x_user_id)
-    return state()
-
-
-def _deal_community(n: int) -> None:
+    with _locked_game(x_user_id) as game:
+        _ensure_single(game)
+        if game.to_act != "player":
+            raise HTTPException(status_code=400, detail="Not player's turn.")
+        if game.status not in ("preflop", "flop", "turn", "river"):
+            raise HTTPException(status_code=400, detail=f"Invalid state: {game.status}")
+
+        action = req.action.lower()
+        if action not in ("stay", "raise", "fold"):
+            raise HTTPException(status_code=400, detail="Invalid action.")
+
+        game.actions[game.seat_of["Player"]] = action
+
+        if action == "fold":
+            _finish_on_fold(game, "Player")
+            return _response(game)
+
+        if action == "stay":
+            _call_or_check(game, "Player")
+        elif action == "raise":
+            if not req.amount or req.amount <= 0:
+                raise HTTPException(status_code=400, detail="Raise amount must be > 0")
+            _call_and_raise(game, "Player", req.amount)
+
+        game.to_act = "cpu"
+        _cpu_take_turns(game)
+        if game.status != "finished" and game.to_act == "player" and _round_settled(game):
+            _maybe_progress_round(game)
+        return _response(game)
+
+
+def _deal_community(game: GameStateCore, n: int) -> None:
     """Deal n community cards."""
-    if TEXAS_GAME is None:
-        raise HTTPException(
-            status_code=400,
-            detail="No active round. Call /texas/single/start first.",
-        )
-    for _ in range(n):
-        TEXAS_GAME.community_cards.append(draw(TEXAS_GAME._deck))
+    dealt = draw(game, n)
+    game.board.extend(dealt)
+    game.off_board = [c for c in game.off_board if c not in dealt]
 
 
-@app.post("/texas/flop")
-def flop(x_user_id: str = Header(...)) -> GameState:
-    """Deal the flop (3 community cards)."""
-    _activate_session(x_user_id)
-    if TEXAS_GAME is None:
-        raise HTTPException(
-            status_code=400,
-            detail="No active round. Call /texas/single/start first.",
-        )
-    s = state()
-    if s.status != "preflop":
-        raise HTTPException(status_code=400, detail=f"Invalid state for flop: {s.status}")
-    if not _round_settled():
+def _require_street(game: GameStateCore, expected: str, street: str) -> None:
+    """Ensure the game is at the expected stage with every bet settled."""
+    if game.status != expected:
+        raise HTTPException(status_code=400, detail=f"Invalid state for {street}: {game.status}")
+    if not _round_settled(game):
         raise HTTPException(status_code=400, detail="Not all players have settled their bets.")
-    _deal_community(3)
-    TEXAS_GAME.status = "flop"
-    _save_session(x_user_id)
-    return state()
 
 
-@app.post("/texas/turn")
-def turn(x_user_id: str = Header(...)) -> GameState:
+@app.post("/texas/flop", response_model=GameState)
+def flop(x_user_id: str = Header(...)) -> Response:
+    """Deal the flop (3 community cards)."""
+    with _locked_game(x_user_id) as game:
+        _require_street(game, "preflop", "flop")
+        _deal_community(game, 3)
+        game.status = "flop"
+        return _response(game)
+
+
+@app.post("/texas/turn", response_model=GameState)
+def turn(x_user_id: str = Header(...)) -> Response:
     """Deal the turn (1 community card)."""
-    _activate_session(x_user_id)
-    if TEXAS_GAME is None:
-        raise HTTPException(
-            status_code=400,
-            detail="No active round. Call /texas/single/start first.",
-        )
-    s = state()
-    if s.status != "flop":
-        raise HTTPException(status_code=400, detail=f"Invalid state for turn: {s.status}")
-    if not _round_settled():
-        raise HTTPException(status_code=400, detail="Not all players have settled their bets.")
-    _deal_community(1)
-    TEXAS_GAME.status = "turn"
-    _save_session(x_user_id)
-    return state()
+    with _locked_game(x_user_id) as game:
+        _require_street(game, "flop", "turn")
+        _deal_community(game, 1)
+        game.status = "turn"
+        return _response(game)
 
 
-@app.post("/texas/river")
-def river(x_user_id: str = Header(...)) -> GameState:
+@app.post("/texas/river", response_model=GameState)
+def river(x_user_id: str = Header(...)) -> Response:
     """Deal the river (1 community card)."""
-    _activate_session(x_user_id)
-    if TEXAS_GAME is None:
-        raise HTTPException(
-            status_code=400,
-            detail="No active round. Call /texas/single/start first.",
-        )
-    s = state()
-    if s.status != "turn":
-        raise HTTPException(status_code=400, detail=f"Invalid state for river: {s.status}")
-    if not _round_settled():
-        raise HTTPException(status_code=400, detail="Not all players have settled their bets.")
-    _deal_community(1)
-    TEXAS_GAME.status = "river"
-    _save_session(x_user_id)
-    return state()
+    with _locked_game(x_user_id) as game:
+        _require_street(game, "turn", "river")
+        _deal_community(game, 1)
+        game.status = "river"
+        return _response(game)
 
 
-@app.post("/texas/showdown")
-def showdown(x_user_id: str = Header(...)) -> GameState:
+@app.post("/texas/showdown", response_model=GameState)
+def showdown(x_user_id: str = Header(...)) -> Response:
     """Evaluate hands and determine winner(s)."""
-    _activate_session(x_user_id)
-    if TEXAS_GAME is None:
-        raise HTTPException(
-            status_code=400,
-            detail="No active round. Call /texas/single/start first.",
-        )
-    s = state()
-    if s.status != "river":
-        raise HTTPException(status_code=400, detail=f"Invalid state for showdown: {s.status}")
-    if not _round_settled():
-        raise HTTPException(status_code=400, detail="Not all players have settled their bets.")
+    with _locked_game(x_user_id) as game:
+        _require_street(game, "river", "showdown")
+        _settle_showdown(game)
+        return _response(game)
 
-    # Evaluate all players
-    community = TEXAS_GAME.community_cards
-    scores: dict[str, tuple[int, list[int]]] = {}
-    for player, hand in TEXAS_GAME.players_hands.items():
-        if TEXAS_GAME.folded and player in TEXAS_GAME.folded:
-            continue
-        combined = hand + community  # player's full hand
-        scores[player] = evaluate_best_hand(combined)
-
-    # find best
-    best_players: list[str] = []
-    best_score: tuple[int, list[int]] | None = None
-    for p, sc in scores.items():  # player, score
-        if best_score is None or sc > best_score:  # found new best score
-            best_score = sc
-            best_players = [p]  # new winner list
-        elif sc == best_score:
-            best_players.append(p)  # tie for best score
-
-    TEXAS_GAME.winners = best_players
-    TEXAS_GAME.status = "finished"
-    TEXAS_GAME.winning_number = best_score
-    if TEXAS_GAME.player_stacks is not None:
-        pot = TEXAS_GAME.pot or 0
-        if best_players:
-            split = pot // len(best_players)
-            remainder = pot % len(best_players)
-            for i, p in enumerate(best_players):
-                TEXAS_GAME.player_stacks[p] += split + (1 if i < remainder else 0)
-    _save_session(x_user_id)
-    return state()
-
-
-@app.get("/texas/state")
-def get_state(x_user_id: str = Header(...)) -> GameState:
+
+@app.get("/texas/state", response_model=GameState)
+def get_state(x_user_id: str = Header(...)) -> Response:
     """Get current game state."""
-    _activate_session(x_user_id)
-    return state()
+    with _locked_game(x_user_id) as game:
+        return _response(game)
@@ -2,7 +2,10 @@
 import pytest
 from fastapi.testclient import TestClient
 
-from main import app, SESSIONS
+from main import (
+    app, SESSIONS, CARD_INT, DECK52_INT, compare_hands, evaluate_best_hand, _deal_community,
+    _get_hand_potential, _settle_showdown,
+)
 
 client = TestClient(app)
 
@@ -77,6 +80,24 @@ class TestGameFlow:
         resp = client.get("/texas/state", headers={"X-User-ID": "no-game-user"})
         assert resp.status_code == 400
 
+    def test_game_lock_released_after_error(self):
+        """A 400 raised while holding the game lock must not leave the game locked."""
+        client.post("/texas/single/start", json=DEFAULT_START, headers={"X-User-ID": "poker-1"})
+        resp = client.post(
+            "/texas/single/action",
+            json={"action": "dance", "amount": 0},
+            headers={"X-User-ID": "poker-1"},
+        )
+        assert resp.status_code == 400
+        assert not SESSIONS["poker-1"]["game"].lock.locked()
+
+        resp = client.post(
+            "/texas/single/action",
+            json={"action": "stay", "amount": 0},
+            headers={"X-User-ID": "poker-1"},
+        )
+        assert resp.status_code == 200
+
 
 class TestSessionIsolation:
     """Test that different users get independent poker sessions."""
@@ -152,3 +173,111 @@ class TestSessionIsolation:
         for i in range(5):
             state = client.get("/texas/state", headers={"X-User-ID": f"poker-{i}"}).json()
             assert state["bet"] == (i + 1) * 5
+
+
+class TestHandEvaluator:
+    """Test the table-driven hand evaluator against known hands."""
+
+    @pytest.mark.parametrize("cards, expected", [
+        (["AS", "KD", "9C", "7H", "3S"], (1, [14, 13, 9, 7, 3])),
+        (["AS", "AD", "9C", "7H", "3S"], (2, [14, 9, 7, 3])),
+        (["AS", "AD", "9C", "9H", "3S"], (3, [14, 9, 3])),
+        (["AS", "AD", "AC", "7H", "3S"], (4, [14, 7, 3])),
+        (["9S", "8D", "7C", "6H", "5S"], (5, [9])),
+        (["AH", "JH", "9H", "7H", "3H"], (6, [14, 11, 9, 7, 3])),
+        (["AS", "AD", "AC", "9H", "9S"], (7, [14, 9])),
+        (["AS", "AD", "AC", "AH", "3S"], (8, [14, 3])),
+        (["9H", "8H", "7H", "6H", "5H"], (9, [9])),
+        (["AS", "KS", "QS", "JS", "10S"], (10, [14])),
+    ])
+    def test_each_category(self, cards, expected):
+        assert evaluate_best_hand(cards) == expected
+
+    def test_wheel_is_five_high_straight(self):
+        assert evaluate_best_hand(["AS", "2D", "3C", "4H", "5S"]) == (5, [5])
+        assert compare_hands(["AS", "2D", "3C", "4H", "5S"], ["6S", "2D", "3C", "4H", "5S"]) == -1
+
+    def test_steel_wheel(self):
+        assert evaluate_best_hand(["AH", "2H", "3H", "4H", "5H", "KS", "KD"]) == (9, [5])
+
+    def test_flush_beats_straight(self):
+        flush = ["2H", "5H", "8H", "JH", "KH"]
+        straight = ["10S", "JD", "QC", "KH", "AS"]
+        assert compare_hands(flush, straight) == 1
+
+    def test_full_house_beats_flush(self):
+        full_house = ["2S", "2D", "2C", "3H", "3S"]
+        flush = ["AH", "KH", "QH", "JH", "9H"]
+        assert compare_hands(full_house, flush) == 1
+
+    def test_kicker_breaks_tie(self):
+        board = ["AS", "AD", "9C", "7H", "3S"]
+        assert compare_hands(board + ["KC", "2D"], board + ["QC", "2H"]) == 1
+
+    def test_same_best_five_ties(self):
+        board = ["AS", "KD", "QC", "JH", "9S"]
+        assert compare_hands(board + ["2C", "3D"], board + ["4C", "5D"]) == 0
+
+    def test_seven_cards_with_five_card_flush(self):
+        # Five hearts plus a pair outside the suit: the flush is the best hand
+        cards = ["AH", "KH", "2D", "2C", "9H", "7H", "3H"]
+        assert evaluate_best_hand(cards) == (6, [14, 13, 9, 7, 3])
+
+    def test_seven_cards_with_six_card_flush_uses_top_five(self):
+        cards = ["AH", "KH", "QH", "9H", "7H", "3H", "2S"]
+        assert evaluate_best_hand(cards) == (6, [14, 13, 12, 9, 7])
+
+    def test_seven_cards_prefer_full_house_over_trips_and_two_pair(self):
+        cards = ["KS", "KD", "KC", "4H", "4S", "2D", "2C"]
+        assert evaluate_best_hand(cards) == (7, [13, 4])
+
+    def test_mutating_result_does_not_corrupt_table(self):
+        cards = ["AS", "KD", "9C", "7H", "3S"]
+        evaluate_best_hand(cards)[1].clear()
+        assert evaluate_best_hand(cards) == (1, [14, 13, 9, 7, 3])
+
+
+def _ints(*cards):
+    return [CARD_INT[c] for c in cards]
+
+
+class TestHandPotential:
+    """Test the CPU's Monte Carlo equity estimate with a fixed seed."""
+
+    def test_pocket_aces_preflop(self):
+        equity = _get_hand_potential(_ints("AS", "AH"), [], list(DECK52_INT), seed=1)
+        assert equity == pytest.approx(0.85, abs=0.05)
+
+    def test_weak_hand_preflop(self):
+        equity = _get_hand_potential(_ints("7C", "2D"), [], list(DECK52_INT), seed=1)
+        assert equity == pytest.approx(0.35, abs=0.05)
+
+    def test_nuts_on_river(self):
+        board = _ints("QS", "JS", "10S", "2H", "3D")
+        off_board = [c for c in DECK52_INT if c not in board]
+        assert _get_hand_potential(_ints("AS", "KS"), board, off_board, seed=1) == 1.0
+
+    def test_seed_is_reproducible(self):
+        hand = _ints("9H", "8H")
+        board = _ints("7H", "2H", "KC")
+        off_board = [c for c in DECK52_INT if c not in board]
+        first = _get_hand_potential(hand, board, off_board, seed=7)
+        assert _get_hand_potential(hand, board, off_board, seed=7) == first
+
+
+class TestShowdown:
+    """Test showdown settlement."""
+
+    def test_uncontested_showdown_reports_winning_hand(self):
+        """A lone remaining player still gets their hand scored, as before."""
+        client.post("/texas/single/start", json=DEFAULT_START, headers={"X-User-ID": "poker-1"})
+        game = SESSIONS["poker-1"]["game"]
+        _deal_community(game, 5)
+        game.active_mask = 1 << game.seat_of["Player"]  # everyone else folded
+
+        _settle_showdown(game)
+        assert game.status == "finished"
+        assert game.winners == ["Player"]
+        assert game.winning_number == evaluate_best_hand(
+            game.players_hands["Player"] + game.community_cards
+        )
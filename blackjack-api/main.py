@@ -1,10 +1,11 @@
 import asyncio
+import threading
 import time
-from contextlib import asynccontextmanager
-from typing import List, Dict, Any
+from contextlib import asynccontextmanager, contextmanager
+from typing import List, Dict, Any, Optional
 
 import random
-from fastapi import FastAPI, Header, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Response
 from pydantic import BaseModel
 
 
@@ -22,6 +23,14 @@ def get_game(user_id: str) -> Dict[str, Any]:
     return session["game"]
 
 
+@contextmanager
+def locked_game(user_id: str):
+    """Get a user's game and hold its lock, so requests for one game run one at a time."""
+    game = get_game(user_id)
+    with game["lock"]:
+        yield game
+
+
 def set_game(user_id: str, game: Dict[str, Any]) -> None:
     """Store game state for a specific user."""
     SESSIONS[user_id] = {"game": game, "last_active": time.time()}
@@ -68,28 +77,38 @@ class GameState(BaseModel):
 SUITS = ["S", "H", "D", "C"]
 RANKS = ["2","3","4","5","6","7","8","9","10","J","Q","K","A"]
 
-def new_deck() -> List[str]:
-    deck = [f"{r}{s}" for s in SUITS for r in RANKS]
-    random.shuffle(deck)
+DECK = tuple(f"{r}{s}" for s in SUITS for r in RANKS)  # unshuffled deck, built once
+_RNG = random.Random()  # long-lived generator used for shuffling
+
+def new_deck(seed: Optional[int] = None) -> List[str]:
+    """Return a new shuffled deck; pass a seed for a reproducible one, e.g. in tests."""
+    deck = list(DECK)
+    (random.Random(seed) if seed is not None else _RNG).shuffle(deck)
     return deck
 
-def draw(deck: List[str]) -> str:
-    if not deck:
+def draw(game: Dict[str, Any]) -> str:
+    """Draw the next card from the game's deck by advancing its cursor."""
+    idx = game["deck_idx"]
+    if idx >= len(game["deck"]):
         raise HTTPException(status_code=500, detail="Deck is empty.")
-    return deck.pop()
+    game["deck_idx"] = idx + 1
+    return game["deck"][idx]
+
+# Card string -> blackjack value, with Aces counted as 11
+CARD_VALUE: Dict[str, int] = {
+    f"{r}{s}": 10 if r in ("J","Q","K") else 11 if r == "A" else int(r)
+    for s in SUITS for r in RANKS
+}
 
 def hand_total(hand: List[str]) -> int:
+    """Count a hand's total from scratch; deal_card's cached totals are tested against it."""
     total = 0
     aces = 0
     for card in hand:
-        rank = card[:-1]  # everything except suit
-        if rank in ("J","Q","K"):
-            total += 10
-        elif rank == "A":
-            total += 11
+        value = CARD_VALUE[card]
+        total += value
+        if value == 11:
             aces += 1
-        else:
-            total += int(rank)
 
     # Convert Aces from 11 to 1 as needed
     while total > 21 and aces > 0:
@@ -98,30 +117,49 @@ def hand_total(hand: List[str]) -> int:
     return total
 
 
-def make_state(game: Dict[str, Any]) -> GameState:
-    """Build a GameState response from a game dict."""
-    p = game["player_hand"]
-    d = game["dealer_hand"]
-    return GameState(
-        player_hand=p,
-        dealer_hand=d,
-        player_total=hand_total(p),
-        dealer_total=hand_total(d),
+def make_state(game: Dict[str, Any]) -> Response:
+    """Build a GameState response from a game dict.
+
+    Totals are cached on the game and the dict is built server-side, so the model is
+    constructed without validation and serialized straight to JSON.
+    """
+    state = GameState.model_construct(
+        player_hand=game["player_hand"],
+        dealer_hand=game["dealer_hand"],
+        player_total=game["player_total"],
+        dealer_total=game["dealer_total"],
         bet=game["bet"],
         status=game["status"]
     )
+    return Response(state.model_dump_json(), media_type="application/json")
+
+
+def deal_card(game: Dict[str, Any], who: str) -> None:
+    """Draw a card into who's hand ("player" or "dealer") and update its total in place."""
+    card = draw(game)
+    game[f"{who}_hand"].append(card)
+    value = CARD_VALUE[card]
+    total = game[f"{who}_total"] + value
+    aces = game[f"{who}_aces"] + (value == 11)  # Aces still counted as 11
+
+    # Convert Aces from 11 to 1 as needed
+    while total > 21 and aces > 0:
+        total -= 10
+        aces -= 1
+    game[f"{who}_total"] = total
+    game[f"{who}_aces"] = aces
 
 
 def dealer_play(game: Dict[str, Any]):
     """Dealer hits until 17+."""
-    while hand_total(game["dealer_hand"]) < 17:
-        game["dealer_hand"].append(draw(game["deck"]))
+    while game["dealer_total"] < 17:
+        deal_card(game, "dealer")
 
 
 def resolve(game: Dict[str, Any]):
     """Set final status if player hasn't busted."""
-    p = hand_total(game["player_hand"])
-    d = hand_total(game["dealer_hand"])
+    p = game["player_total"]
+    d = game["dealer_total"]
     if d > 21:
         game["status"] = "dealer_bust"
     elif p > d:
@@ -142,21 +180,25 @@ def start(req: StartRequest, x_user_id: str = Header(...)):
     if req.bet <= 0:
         raise HTTPException(status_code=400, detail="Bet must be > 0")
 
-    deck = new_deck()
-    player = [draw(deck), draw(deck)]
-    dealer = [draw(deck), draw(deck)]
-
     game = {
-        "deck": deck,
-        "player_hand": player,
-        "dealer_hand": dealer,
+        "deck": new_deck(),
+        "deck_idx": 0,
+        "player_hand": [],
+        "dealer_hand": [],
+        "player_total": 0,
+        "dealer_total": 0,
+        "player_aces": 0,
+        "dealer_aces": 0,
         "bet": req.bet,
-        "status": "in_progress"
+        "status": "in_progress",
+        "lock": threading.Lock()
     }
+    for who in ("player", "player", "dealer", "dealer"):
+        deal_card(game, who)
 
     # Optional quick blackjack check
-    p_total = hand_total(player)
-    d_total = hand_total(dealer)
+    p_total = game["player_total"]
+    d_total = game["dealer_total"]
     if p_total == 21 and d_total == 21:
         game["status"] = "push"
     elif p_total == 21:
@@ -169,28 +211,28 @@ def start(req: StartRequest, x_user_id: str = Header(...)):
 
 @app.post("/blackjack/hit", response_model=GameState)
 def hit(x_user_id: str = Header(...)):
-    game = get_game(x_user_id)
-    if game["status"] != "in_progress":
-        raise HTTPException(status_code=400, detail=f"Round is not active: {game['status']}")
+    with locked_game(x_user_id) as game:
+        if game["status"] != "in_progress":
+            raise HTTPException(status_code=400, detail=f"Round is not active: {game['status']}")
 
-    game["player_hand"].append(draw(game["deck"]))
+        deal_card(game, "player")
 
-    if hand_total(game["player_hand"]) > 21:
-        game["status"] = "player_bust"
+        if game["player_total"] > 21:
+            game["status"] = "player_bust"
 
-    return make_state(game)
+        return make_state(game)
 
 @app.post("/blackjack/stand", response_model=GameState)
 def stand(x_user_id: str = Header(...)):
-    game = get_game(x_user_id)
-    if game["status"] != "in_progress":
-        raise HTTPException(status_code=400, detail=f"Round is not active: {game['status']}")
+    with locked_game(x_user_id) as game:
+        if game["status"] != "in_progress":
+            raise HTTPException(status_code=400, detail=f"Round is not active: {game['status']}")
 
-    dealer_play(game)
-    resolve(game)
-    return make_state(game)
+        dealer_play(game)
+        resolve(game)
+        return make_state(game)
 
 @app.get("/blackjack/state", response_model=GameState)
 def get_state(x_user_id: str = Header(...)):
-    game = get_game(x_user_id)
-    return make_state(game)
+    with locked_game(x_user_id) as game:
+        return make_state(game)
@@ -2,7 +2,7 @@
 import pytest
 from fastapi.testclient import TestClient
 
-from main import app, SESSIONS
+from main import app, SESSIONS, deal_card, hand_total
 
 client = TestClient(app)
 
@@ -71,6 +71,17 @@ class TestGameFlow:
         resp = client.get("/blackjack/state", headers={"X-User-ID": "no-game-user"})
         assert resp.status_code == 400
 
+    def test_game_lock_released_after_error(self):
+        """A 400 raised while holding the game lock must not leave the game locked."""
+        client.post("/blackjack/start", json={"bet": 10}, headers={"X-User-ID": "user-1"})
+        client.post("/blackjack/stand", headers={"X-User-ID": "user-1"})
+        resp = client.post("/blackjack/hit", headers={"X-User-ID": "user-1"})
+        assert resp.status_code == 400
+        assert not SESSIONS["user-1"]["game"]["lock"].locked()
+
+        resp = client.get("/blackjack/state", headers={"X-User-ID": "user-1"})
+        assert resp.status_code == 200
+
 
 class TestSessionIsolation:
     """Test that different users get independent game sessions."""
@@ -135,3 +146,19 @@ class TestSessionIsolation:
 
         state = client.get("/blackjack/state", headers={"X-User-ID": "restart-user"}).json()
         assert state["bet"] == 99
+
+
+class TestIncrementalTotals:
+    """Test that deal_card's cached totals match a full hand_total recount."""
+
+    @pytest.mark.parametrize("cards, totals", [
+        (["AS", "AH", "9D"], [11, 12, 21]),
+        (["AS", "6H", "KD"], [11, 17, 17]),
+        (["10S", "6H", "AD"], [10, 16, 17]),
+    ])
+    def test_totals_after_each_card(self, cards, totals):
+        game = {"deck": cards, "deck_idx": 0, "player_hand": [], "player_total": 0, "player_aces": 0}
+        for expected in totals:
+            deal_card(game, "player")
+            assert game["player_total"] == expected
+            assert game["player_total"] == hand_total(game["player_hand"])
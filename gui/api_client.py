@@ -3,15 +3,25 @@
 In native mode (desktop), uses the `requests` library with synchronous calls.
 In WASM mode (browser via pygbag), uses JavaScript fetch via the platform module.
 
+The `_async` variants return a `concurrent.futures.Future` so the game loop can
+keep drawing while a request is in flight. Natively they run on a small worker
+pool; in WASM there are no threads, so the request runs immediately and the
+returned future is already done.
+
 Usage:
     from api_client import api_get, api_post, configure_base_url
     configure_base_url("http://localhost:8080/api")  # or relative "/api" in WASM
 
     data = api_post("/blackjack/start", {"bet": 100})
     state = api_get("/blackjack/state")
+
+    future = api_get_async("/blackjack/state")
+    if future.done():
+        state = future.result()
 """
 import json
 import sys
+from concurrent.futures import Future
 
 # Detect WASM environment (pygbag sets sys.platform to "emscripten")
 IS_WASM = sys.platform == "emscripten"
@@ -62,19 +72,60 @@ if IS_WASM:
         xhr.send()
         return json.loads(xhr.responseText)
 
+    def _completed(fn, *args) -> Future:
+        """Run fn now and wrap its result (or error) in a finished future."""
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def api_post_async(path: str, data: dict | None = None) -> Future:
+        """POST request returning a future (runs synchronously in WASM)."""
+        return _completed(api_post, path, data)
+
+    def api_get_async(path: str) -> Future:
+        """GET request returning a future (runs synchronously in WASM)."""
+        return _completed(api_get, path)
+
 else:
     # Native mode: use requests library
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
     import requests
 
+    # One Session per thread, so connections are reused without sharing a Session
+    # (which requests doesn't guarantee is thread-safe) between pool workers
+    _local = threading.local()
+
+    def _session() -> requests.Session:
+        """Return this thread's Session, creating it on first use."""
+        session = getattr(_local, "session", None)
+        if session is None:
+            session = _local.session = requests.Session()
+        return session
+
+    # Background workers for the _async calls, so requests don't stall a frame
+    _io_pool = ThreadPoolExecutor(max_workers=2)
+
     def api_post(path: str, data: dict | None = None) -> dict:
         """POST request using requests library (native Python)."""
         url = _full_url(path)
-        response = requests.post(url, data=json.dumps(data) if data else None,
-                                 headers={"Content-Type": "application/json"})
+        response = _session().post(url, json=data)
         return response.json()
 
     def api_get(path: str) -> dict:
         """GET request using requests library (native Python)."""
         url = _full_url(path)
-        response = requests.get(url)
+        response = _session().get(url)
         return response.json()
+
+    def api_post_async(path: str, data: dict | None = None) -> Future:
+        """POST request on a background worker, returning a future."""
+        return _io_pool.submit(api_post, path, data)
+
+    def api_get_async(path: str) -> Future:
+        """GET request on a background worker, returning a future."""
+        return _io_pool.submit(api_get, path)
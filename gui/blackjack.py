@@ -1,12 +1,12 @@
 # ----- Imports -----
 from enum import Enum
-import json
+from itertools import chain
 
 import pygame
 import pygame_gui
 from pygame_gui.core import ObjectID
 
-from api_client import api_get, api_post
+from api_client import api_post_async
 from card import Card
 from scene import (Scene, SceneID, WHITE_CHIP_WORTH, RED_CHIP_WORTH, GREEN_CHIP_WORTH,
                    BLUE_CHIP_WORTH, BLACK_CHIP_WORTH, MENU_BUTTON_TEXT, MENU_BUTTON_LOCATION,
@@ -31,6 +31,7 @@ class BlackjackGameState(Enum):
     WAITING_DEALER_CARD = 11# Animation delay for dealer's hit card
     DEALER_TURN = 12        # Dealer AI logic (hit until 17)
     GAME_OVER = 13          # Results displayed, waiting for reset
+    WAITING_API = 14        # Waiting on a background API request
 
 # ----- Globals/Constants -----
 BLACKJACK_BUTTON_SIZE = (150, 50)
@@ -81,6 +82,41 @@ BLACKJACK_BALANCE_LABEL_LOCATION = (50, 50)
 BLACKJACK_RESULT_LABEL_SIZE = (400, 60)
 BLACKJACK_STARTING_BALANCE = 2500
 
+# Layout rects, built once at import rather than on every scene build
+BLACKJACK_MENU_RECT = pygame.Rect(MENU_BUTTON_LOCATION, MENU_BUTTON_SIZE)
+BLACKJACK_DEAL_RECT = pygame.Rect(BLACKJACK_DEAL_BUTTON_LOCATION, BLACKJACK_BUTTON_SIZE)
+BLACKJACK_RESET_RECT = pygame.Rect(BLACKJACK_RESET_BUTTON_LOCATION, BLACKJACK_BUTTON_SIZE)
+BLACKJACK_BET_AMOUNT_RECT = pygame.Rect(BLACKJACK_BET_AMOUNT_LOCATION, BLACKJACK_BET_AMOUNT_SIZE)
+BLACKJACK_CHIP_CONTAINER_RECT = pygame.Rect(
+    BLACKJACK_CHIP_CONTAINER_LOCATION, BLACKJACK_CHIP_CONTAINER_SIZE)
+BLACKJACK_WHITE_CHIP_RECT = pygame.Rect(BLACKJACK_WHITE_CHIP_LOCATION, BLACKJACK_CHIP_SIZE)
+BLACKJACK_RED_CHIP_RECT = pygame.Rect(BLACKJACK_RED_CHIP_LOCATION, BLACKJACK_CHIP_SIZE)
+BLACKJACK_GREEN_CHIP_RECT = pygame.Rect(BLACKJACK_GREEN_CHIP_LOCATION, BLACKJACK_CHIP_SIZE)
+BLACKJACK_BLUE_CHIP_RECT = pygame.Rect(BLACKJACK_BLUE_CHIP_LOCATION, BLACKJACK_CHIP_SIZE)
+BLACKJACK_BLACK_CHIP_RECT = pygame.Rect(BLACKJACK_BLACK_CHIP_LOCATION, BLACKJACK_CHIP_SIZE)
+BLACKJACK_PLAYER_SCORE_RECT = pygame.Rect(BLACKJACK_PLAYER_SCORE_LOCATION, BLACKJACK_SCORE_SIZE)
+BLACKJACK_PLAYER_SCORE_LABEL_RECT = pygame.Rect(
+    BLACKJACK_PLAYER_SCORE_LABEL_LOCATION, BLACKJACK_SCORE_LABEL_SIZE)
+BLACKJACK_DEALER_SCORE_RECT = pygame.Rect(BLACKJACK_DEALER_SCORE_LOCATION, BLACKJACK_SCORE_SIZE)
+BLACKJACK_DEALER_SCORE_LABEL_RECT = pygame.Rect(
+    BLACKJACK_DEALER_SCORE_LABEL_LOCATION, BLACKJACK_SCORE_LABEL_SIZE)
+BLACKJACK_BALANCE_LABEL_RECT = pygame.Rect(
+    BLACKJACK_BALANCE_LABEL_LOCATION, BLACKJACK_BALANCE_LABEL_SIZE)
+
+# Where the i-th card of each hand comes to rest. Each round deals from one 52-card deck,
+# so the longest hand is A,A,A,A,2,2,2,2,3,3,3 (21 in 11 cards) plus one more hit, which
+# the API allows at 21 and which busts on the 12th card.
+# Cards only ever read their target_location, so these vectors can be shared.
+BLACKJACK_MAX_HAND_SIZE = 12
+BLACKJACK_PLAYER_SLOTS = tuple(
+    pygame.Vector2(BLACKJACK_PLAYER_LOCATION[0] + BLACKJACK_CARD_HELD_OFFSET * i,
+                   BLACKJACK_PLAYER_LOCATION[1])
+    for i in range(BLACKJACK_MAX_HAND_SIZE))
+BLACKJACK_DEALER_SLOTS = tuple(
+    pygame.Vector2(BLACKJACK_DEALER_LOCATION[0] + BLACKJACK_CARD_HELD_OFFSET * i,
+                   BLACKJACK_DEALER_LOCATION[1])
+    for i in range(BLACKJACK_MAX_HAND_SIZE))
+
 class BlackjackScene(Scene):
     """
     Handles the logic and UI for the Blackjack game mode.
@@ -101,46 +137,45 @@ class BlackjackScene(Scene):
         self.bet_amount = WHITE_CHIP_WORTH
         self.player_cards = []
         self.dealer_cards = []
-        self.blackjack_cards = []
+        # Cards currently animating; Card adds/removes itself as it starts/stops
+        self.moving_cards = set()
+        self.flipping_cards = set()
+        self._pending = None      # in-flight API future while WAITING_API
+        self._on_response = None  # called with _pending once it finishes
+        self._hit_status = None   # round status returned by the last /hit
+        self._stand_data = None   # final round state returned by /blackjack/stand
 
         # Navigation
         self.menu_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(MENU_BUTTON_LOCATION, MENU_BUTTON_SIZE),
+            relative_rect=BLACKJACK_MENU_RECT,
             text=MENU_BUTTON_TEXT,
             manager=self.ui_manager,
             container=self.scene_container)
 
         # Game Control Buttons
         self.deal_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(
-                BLACKJACK_DEAL_BUTTON_LOCATION,
-                BLACKJACK_BUTTON_SIZE),
+            relative_rect=BLACKJACK_DEAL_RECT,
             text=BLACKJACK_DEAL_BUTTON_TEXT,
             manager=self.ui_manager,
             container=self.scene_container)
         self.reset_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(
-                BLACKJACK_RESET_BUTTON_LOCATION,
-                BLACKJACK_BUTTON_SIZE),
+            relative_rect=BLACKJACK_RESET_RECT,
             text=BLACKJACK_RESET_BUTTON_TEXT,
             manager=self.ui_manager,
             container=self.scene_container)
 
         # Betting Display
         self.bet_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(
-                BLACKJACK_BET_AMOUNT_LOCATION,
-                BLACKJACK_BET_AMOUNT_SIZE),
-            text="$" + str(self.bet_amount),
+            relative_rect=BLACKJACK_BET_AMOUNT_RECT,
+            text=f"${self.bet_amount}",
             manager=self.ui_manager,
             container=self.scene_container,
             object_id="#bet_amount")
+        self._bet_text = f"${self.bet_amount}"  # last text rendered on bet_label
 
         # Chip Selection Panel
         self.chip_container = pygame_gui.elements.UIPanel(
-            relative_rect=pygame.Rect(
-                BLACKJACK_CHIP_CONTAINER_LOCATION,
-                BLACKJACK_CHIP_CONTAINER_SIZE),
+            relative_rect=BLACKJACK_CHIP_CONTAINER_RECT,
             manager=self.ui_manager,
             container=self.scene_container,
             starting_height=90,
@@ -148,50 +183,49 @@ class BlackjackScene(Scene):
 
         # Individual Betting Chips
         self.white_chip = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(
-                BLACKJACK_WHITE_CHIP_LOCATION,
-                BLACKJACK_CHIP_SIZE),
+            relative_rect=BLACKJACK_WHITE_CHIP_RECT,
             text=str(WHITE_CHIP_WORTH),
             manager=self.ui_manager,
             container=self.chip_container,
         object_id = ObjectID(object_id='#white_chip', class_id='@chip_button'))
 
         self.red_chip = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(
-                BLACKJACK_RED_CHIP_LOCATION,
-                BLACKJACK_CHIP_SIZE),
+            relative_rect=BLACKJACK_RED_CHIP_RECT,
             text=str(RED_CHIP_WORTH),
             manager=self.ui_manager,
             container=self.chip_container,
         object_id = ObjectID(object_id='#red_chip', class_id='@chip_button'))
 
         self.green_chip = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(
-                BLACKJACK_GREEN_CHIP_LOCATION,
-                BLACKJACK_CHIP_SIZE),
+            relative_rect=BLACKJACK_GREEN_CHIP_RECT,
             text=str(GREEN_CHIP_WORTH),
             manager=self.ui_manager,
             container=self.chip_container,
         object_id = ObjectID(object_id='#green_chip', class_id='@chip_button'))
 
         self.blue_chip = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(
-                BLACKJACK_BLUE_CHIP_LOCATION,
-                BLACKJACK_CHIP_SIZE),
+            relative_rect=BLACKJACK_BLUE_CHIP_RECT,
             text=str(BLUE_CHIP_WORTH),
             manager=self.ui_manager,
             container=self.chip_container,
         object_id = ObjectID(object_id='#blue_chip', class_id='@chip_button'))
 
         self.black_chip = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(
-                BLACKJACK_BLACK_CHIP_LOCATION,
-                BLACKJACK_CHIP_SIZE),
+            relative_rect=BLACKJACK_BLACK_CHIP_RECT,
             text=str(BLACK_CHIP_WORTH),
             manager=self.ui_manager,
             container=self.chip_container,
         object_id = ObjectID(object_id='#black_chip', class_id='@chip_button'))
 
+        # Chip button -> amount it adds to the bet
+        self._chip_values = {
+            self.white_chip: WHITE_CHIP_WORTH,
+            self.red_chip: RED_CHIP_WORTH,
+            self.green_chip: GREEN_CHIP_WORTH,
+            self.blue_chip: BLUE_CHIP_WORTH,
+            self.black_chip: BLACK_CHIP_WORTH,
+        }
+
         # Gameplay Action Buttons (Hidden until Deal)
         self.hit_button = pygame_gui.elements.UIButton(
             relative_rect=pygame.Rect(
@@ -212,36 +246,28 @@ class BlackjackScene(Scene):
 
         # Player/Dealer Scoreboards
         self.player_score = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(
-                BLACKJACK_PLAYER_SCORE_LOCATION,
-                BLACKJACK_SCORE_SIZE),
+            relative_rect=BLACKJACK_PLAYER_SCORE_RECT,
             text='0',
             manager=self.ui_manager,
             container=self.scene_container,
             object_id="@blackjack_score")
 
         self.player_score_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(
-                BLACKJACK_PLAYER_SCORE_LABEL_LOCATION,
-                BLACKJACK_SCORE_LABEL_SIZE),
+            relative_rect=BLACKJACK_PLAYER_SCORE_LABEL_RECT,
             text=BLACKJACK_PLAYER_LABEL_TEXT,
             manager=self.ui_manager,
             container=self.scene_container,
             object_id="@blackjack_score")
 
         self.dealer_score = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(
-                BLACKJACK_DEALER_SCORE_LOCATION,
-                BLACKJACK_SCORE_SIZE),
+            relative_rect=BLACKJACK_DEALER_SCORE_RECT,
             text='0',
             manager=self.ui_manager,
             container=self.scene_container,
             object_id="@blackjack_score")
 
         self.dealer_score_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(
-                BLACKJACK_DEALER_SCORE_LABEL_LOCATION,
-                BLACKJACK_SCORE_LABEL_SIZE),
+            relative_rect=BLACKJACK_DEALER_SCORE_LABEL_RECT,
             text=BLACKJACK_DEALER_LABEL_TEXT,
             manager=self.ui_manager,
             container=self.scene_container,
@@ -249,9 +275,7 @@ class BlackjackScene(Scene):
 
         self.balance = BLACKJACK_STARTING_BALANCE
         self.balance_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(
-                BLACKJACK_BALANCE_LABEL_LOCATION,
-                BLACKJACK_BALANCE_LABEL_SIZE),
+            relative_rect=BLACKJACK_BALANCE_LABEL_RECT,
             text=f"${self.balance:.2f}",
             manager=self.ui_manager,
             container=self.scene_container,
@@ -265,6 +289,15 @@ class BlackjackScene(Scene):
             container=self.scene_container,
             object_id="#bet_amount")
 
+        # Action button -> handler (the menu button is handled separately
+        # since it leaves the scene)
+        self._button_handlers = {
+            self.deal_button: self._on_deal,
+            self.reset_button: self._on_reset,
+            self.hit_button: self._on_hit,
+            self.stand_button: self._on_stand,
+        }
+
         self.reset_board()
 
     def open_scene(self):
@@ -272,8 +305,20 @@ class BlackjackScene(Scene):
         self.reset_board()
         self.game_state = BlackjackGameState.SETUP
         self.result_label.hide()
-        self.bet_amount = WHITE_CHIP_WORTH
-        self.bet_label.set_text("$" + str(self.bet_amount))
+        self.set_bet(WHITE_CHIP_WORTH)
+        self._pending = self._on_response = None
+
+    def set_bet(self, amount):
+        """
+        Sets the bet amount and updates its label.
+
+        The label is only re-rendered when its text actually changes.
+        """
+        self.bet_amount = amount
+        text = f"${amount}"
+        if text != self._bet_text:
+            self._bet_text = text
+            self.bet_label.set_text(text)
 
     def handle_events(self):
         """
@@ -281,52 +326,64 @@ class BlackjackScene(Scene):
 
         Handles betting increments via chip buttons, scene transitions,
         and triggers state changes for dealing, hitting, and standing.
+        Runs of consecutive mouse motion events are coalesced, so the UI
+        manager only sees the latest position of each run, however fast the
+        mouse reports; a pending motion is always delivered before the next
+        non-motion event, so clicks see the cursor where it really was.
         """
+        last_motion = None
         for event in pygame.event.get():
+            if event.type == pygame.MOUSEMOTION:
+                last_motion = event
+                continue
+            if last_motion is not None:
+                self.ui_manager.process_events(last_motion)
+                last_motion = None
             if event.type == pygame_gui.UI_BUTTON_PRESSED:
-                match event.ui_element:
-                    case self.menu_button:
-                        self.game.change_scene(SceneID.GAME_MENU)
-                        return True
-                    # Update bet amount and label based on chip value
-                    case self.white_chip:
-                        self.bet_amount = self.bet_amount + WHITE_CHIP_WORTH
-                        self.bet_label.set_text("$" + str(self.bet_amount))
-                    case self.red_chip:
-                        self.bet_amount = self.bet_amount + RED_CHIP_WORTH
-                        self.bet_label.set_text("$" + str(self.bet_amount))
-                    case self.green_chip:
-                        self.bet_amount = self.bet_amount + GREEN_CHIP_WORTH
-                        self.bet_label.set_text("$" + str(self.bet_amount))
-                    case self.blue_chip:
-                        self.bet_amount = self.bet_amount + BLUE_CHIP_WORTH
-                        self.bet_label.set_text("$" + str(self.bet_amount))
-                    case self.black_chip:
-                        self.bet_amount = self.bet_amount + BLACK_CHIP_WORTH
-                        self.bet_label.set_text("$" + str(self.bet_amount))
+                # Update bet amount and label based on chip value
+                chip_value = self._chip_values.get(event.ui_element)
+                if chip_value:
+                    self.set_bet(self.bet_amount + chip_value)
+                elif event.ui_element is self.menu_button:
+                    self.game.change_scene(SceneID.GAME_MENU)
+                    return True
+                else:
                     # Transition game states based on action buttons
-                    case self.deal_button:
-                        self.game_state = BlackjackGameState.START_DEAL
-                    case self.reset_button:
-                        self.bet_amount = WHITE_CHIP_WORTH
-                        self.bet_label.set_text("$" + str(self.bet_amount))
-                    case self.hit_button:
-                        self.game_state = BlackjackGameState.GIVE_PLAYER_CARD
-                    case self.stand_button:
-                        self.game_state = BlackjackGameState.PLAYER_STANDS
+                    handler = self._button_handlers.get(event.ui_element)
+                    if handler:
+                        handler()
             self.ui_manager.process_events(event)
+        if last_motion is not None:
+            self.ui_manager.process_events(last_motion)
+
+    def _on_deal(self):
+        """Starts dealing a new round with the current bet."""
+        self.game_state = BlackjackGameState.START_DEAL
+
+    def _on_reset(self):
+        """Resets the bet back to a single white chip."""
+        self.set_bet(WHITE_CHIP_WORTH)
+
+    def _on_hit(self):
+        """Requests another card for the player."""
+        self.game_state = BlackjackGameState.GIVE_PLAYER_CARD
+
+    def _on_stand(self):
+        """Ends the player's turn and hands over to the dealer."""
+        self.game_state = BlackjackGameState.PLAYER_STANDS
 
     def draw_scene(self):
         """
         Renders the scene and executes per-frame card animations.
 
-        Checks all cards in play; if a card is flagged as moving or flipping,
-        it calls the respective animation update method.
+        Only visits the cards that are moving or flipping; cards drop out of
+        these sets on their own when their animation ends.
         """
-        for card in self.blackjack_cards:
-            if card.moving:
+        if self.moving_cards:
+            for card in tuple(self.moving_cards):
                 card.move_card()
-            if card.flipping:
+        if self.flipping_cards:
+            for card in tuple(self.flipping_cards):
                 card.flip_card()
         Scene.draw_scene(self)
 
@@ -354,9 +411,8 @@ class BlackjackScene(Scene):
 
             case BlackjackGameState.DEALING:
                 # Stall logic until all initial dealing animations finish
-                for card in self.blackjack_cards:
-                    if card.moving or card.flipping:
-                        return
+                if self.moving_cards or self.flipping_cards:
+                    return
                 self.game_state = BlackjackGameState.DEALT
 
             case BlackjackGameState.DEALT:
@@ -374,9 +430,8 @@ class BlackjackScene(Scene):
 
             case BlackjackGameState.WAITING_PLAYER_CARD:
                 # Stall logic until the 'Hit' card animation finishes
-                for card in self.player_cards:
-                    if card.moving or card.flipping:
-                        return
+                if self.moving_cards or self.flipping_cards:
+                    return
                 self.game_state = BlackjackGameState.RESOLVING_HIT
 
             case BlackjackGameState.RESOLVING_HIT:
@@ -386,21 +441,41 @@ class BlackjackScene(Scene):
                 self.player_stands()
 
             case BlackjackGameState.WAITING_DEALER_CARD:
-                for card in self.dealer_cards:
-                    if card.moving or card.flipping:
-                        return
+                if self.moving_cards or self.flipping_cards:
+                    return
                 self.game_state = BlackjackGameState.DEALER_TURN
 
             case BlackjackGameState.DEALER_TURN:
                 self.dealer_turn()
 
+            case BlackjackGameState.WAITING_API:
+                # Keep animating until the request finishes, then hand it off
+                if not self._pending.done():
+                    return
+                future, on_response = self._pending, self._on_response
+                self._pending = self._on_response = None
+                on_response(future)
+
+    def wait_for_api(self, future, on_response):
+        """
+        Parks the game in WAITING_API until the request behind future finishes.
+
+        on_response is then called with the finished future, and is responsible
+        for reading its result (or error) and moving to the next state.
+        """
+        self._pending = future
+        self._on_response = on_response
+        self.game_state = BlackjackGameState.WAITING_API
+
     def reset_board(self):
         """
         Clears the current table and re-initializes player and dealer hand objects.
         """
 
-        for card in self.blackjack_cards:
+        for card in chain(self.player_cards, self.dealer_cards):
             card.image.kill()
+        self.moving_cards.clear()
+        self.flipping_cards.clear()
 
         self.player_cards = [
             Card(self, BLACKJACK_CARD_START_LOCATION),
@@ -409,10 +484,6 @@ class BlackjackScene(Scene):
             Card(self, BLACKJACK_CARD_START_LOCATION),
             Card(self, BLACKJACK_CARD_START_LOCATION) ]
 
-        # Master list used for animation loops in draw_scene
-        self.blackjack_cards = self.player_cards.copy()
-        self.blackjack_cards.extend(self.dealer_cards)
-
         self.player_score.set_text("0")
         self.dealer_score.set_text("0")
         self.result_label.hide()
@@ -421,8 +492,8 @@ class BlackjackScene(Scene):
         """
         Initiates a new round by contacting the Blackjack API.
 
-        Disables betting UI, retrieves hand data, sets card faces,
-        and triggers movement animations for the initial four cards.
+        Disables betting UI and requests the opening hands; hand_dealt
+        picks up the response once it arrives.
         """
         self.reset_board()
         self.deal_button.disable()
@@ -431,12 +502,23 @@ class BlackjackScene(Scene):
 
         # Communication with the blackjack API
         payload = {'bet': str(self.bet_amount)}
+        self.wait_for_api(api_post_async('/blackjack/start', payload), self.hand_dealt)
+
+    def hand_dealt(self, future):
+        """
+        Handles the /blackjack/start response.
+
+        Sets card faces and triggers movement animations for the initial four cards.
+        """
         try:
-            data = api_post('/blackjack/start', payload)
+            data = future.result()
         except Exception as e:
-            self.balance += self.bet_amount
-            self.balance_label.set_text(f"${self.balance:.2f}")
+            # Nothing was debited yet; hand the betting UI back so the player can retry
             print(f"API Error: {e}")
+            self.deal_button.enable()
+            self.reset_button.enable()
+            self.chip_container.enable()
+            self.game_state = BlackjackGameState.PRE_DEAL
             return
 
         self.balance -= self.bet_amount
@@ -445,9 +527,8 @@ class BlackjackScene(Scene):
         # Setup Player Cards
         self.player_cards[0].set_front(data["player_hand"][0])
         self.player_cards[1].set_front(data["player_hand"][1])
-        self.player_cards[0].target_location = pygame.Vector2(BLACKJACK_PLAYER_LOCATION)
-        self.player_cards[1].target_location = pygame.Vector2(
-            BLACKJACK_PLAYER_LOCATION[0] + 50, BLACKJACK_PLAYER_LOCATION[1])
+        self.player_cards[0].target_location = BLACKJACK_PLAYER_SLOTS[0]
+        self.player_cards[1].target_location = BLACKJACK_PLAYER_SLOTS[1]
 
         self.player_cards[0].moving = True
         self.player_cards[1].moving = True
@@ -457,9 +538,8 @@ class BlackjackScene(Scene):
         # Setup Dealer Cards
         self.dealer_cards[0].set_front(data["dealer_hand"][0])
         self.dealer_cards[1].set_front(data["dealer_hand"][1])
-        self.dealer_cards[0].target_location = pygame.Vector2(BLACKJACK_DEALER_LOCATION)
-        self.dealer_cards[1].target_location = pygame.Vector2(
-            BLACKJACK_DEALER_LOCATION[0] + 50, BLACKJACK_DEALER_LOCATION[1])
+        self.dealer_cards[0].target_location = BLACKJACK_DEALER_SLOTS[0]
+        self.dealer_cards[1].target_location = BLACKJACK_DEALER_SLOTS[1]
 
         # Trigger animations (Player cards flip, Dealer's second card remains face down)
         for card in self.player_cards:
@@ -477,7 +557,8 @@ class BlackjackScene(Scene):
         self.dealer_score.set_text(str(self.get_card_value(card_value)))
         ##self.dealer_score.set_text(str(data["dealer_total"]))
 
-        self.check_for_blackjack()
+        # /start already reports the round's status, so no separate /state call
+        self.check_for_blackjack(data["status"])
 
     def get_card_value(self, card_id):
         """
@@ -501,14 +582,13 @@ class BlackjackScene(Scene):
         except ValueError:
             return 0  # Or handle invalid inputs as needed
 
-    def check_for_blackjack(self):
-        """Checks the API for immediate win conditions (Naturals) after the deal."""
-        data = api_get('/blackjack/state')
-        match data["status"]:
+    def check_for_blackjack(self, status):
+        """Checks the dealt round's status for immediate win conditions (Naturals)."""
+        match status:
             case "dealer_win":
-                self.finish_hand(data["status"])
+                self.finish_hand(status)
             case "player_win":
-                self.finish_hand(data["status"])
+                self.finish_hand(status)
             case _:
                 self.game_state = BlackjackGameState.DEALING
 
@@ -522,33 +602,43 @@ class BlackjackScene(Scene):
         self.hit_button.disable()
         self.stand_button.disable()
 
-        data = api_post('/blackjack/hit')
+        self.wait_for_api(api_post_async('/blackjack/hit'), self.player_card_received)
+
+    def player_card_received(self, future):
+        """Handles the /blackjack/hit response by animating the new card into the hand."""
+        try:
+            data = future.result()
+        except Exception as e:
+            print(f"Hit API Error: {e}")
+            self.hit_button.enable()
+            self.stand_button.enable()
+            self.game_state = BlackjackGameState.PLAYER_TURN
+            return
 
         new_card = Card(self, BLACKJACK_CARD_START_LOCATION)
         self.player_cards.append(new_card)
-        self.blackjack_cards.append(self.player_cards[-1])
 
         self.player_cards[-1].set_front(data["player_hand"][-1])
-        self.player_cards[-1].target_location = pygame.Vector2(
-            BLACKJACK_PLAYER_LOCATION[0] + BLACKJACK_CARD_HELD_OFFSET * (len(self.player_cards) - 1),
-            BLACKJACK_PLAYER_LOCATION[1])
+        self.player_cards[-1].target_location = BLACKJACK_PLAYER_SLOTS[len(self.player_cards) - 1]
 
         new_card.moving = True
         new_card.move_then_flip = True
 
         self.player_score.set_text(str(data["player_total"]))
+        # /hit reports the post-hit status; resolve_hit reads it once the card lands
+        self._hit_status = data["status"]
         #self.game_state = BlackjackGameState.RESOLVING_HIT
         self.game_state = BlackjackGameState.WAITING_PLAYER_CARD
 
     def resolve_hit(self):
         """Checks if the player has busted or won after receiving a 'Hit' card."""
-        data = api_get('/blackjack/state')
-        match data["status"]:
+        status = self._hit_status
+        match status:
             ## TODO: add game over animations to game_over gs
             case "player_bust":
-                self.finish_hand(data["status"])
+                self.finish_hand(status)
             case "player_win":
-                self.finish_hand(data["status"])
+                self.finish_hand(status)
             case "in_progress":
                 self.hit_button.enable()
                 self.stand_button.enable()
@@ -565,14 +655,23 @@ class BlackjackScene(Scene):
         self.stand_button.disable()
 
         # Tell the API the player is done so it can process the dealer's hand.
+        self.wait_for_api(api_post_async('/blackjack/stand'), self.stand_received)
+
+    def stand_received(self, future):
+        """Handles the /blackjack/stand response by revealing the dealer's cards."""
         try:
-            data = api_post('/blackjack/stand')
+            data = future.result()
         except Exception as e:
             print(f"Stand API Error: {e}")
             self.hit_button.enable()
             self.stand_button.enable()
+            self.game_state = BlackjackGameState.PLAYER_TURN
             return
 
+        # The API plays out the dealer's whole hand on /stand, so this response
+        # is the final state dealer_turn animates towards
+        self._stand_data = data
+
         # Reveal the first dealer card (the one typically dealt face-down)
         self.dealer_cards[0].flipping = True
         self.game_state = BlackjackGameState.WAITING_DEALER_CARD
@@ -581,21 +680,16 @@ class BlackjackScene(Scene):
 
     def dealer_turn(self):
         """
-        Monitors the dealer's hand state via the API and animates new cards.
+        Animates the dealer's hand towards the final state from /stand.
 
-        This method polls the API to see the dealer's final hand. If the
-        local table is missing cards, it adds them one by one to create
-        a natural dealing sequence.
+        The /stand response already holds the dealer's final hand, so there
+        is nothing to poll. If the local table is missing cards, it adds
+        them one by one to create a natural dealing sequence.
         """
         if not self.dealer_cards[1].flipped:
             self.dealer_cards[1].flipping = True
 
-        try:
-            data = api_get('/blackjack/state')
-        except Exception as e:
-            print(f"State API Error: {e}")
-            return
-
+        data = self._stand_data
 
         # Check if the dealer hand on the API is larger than what we see on screen.
         if len(self.dealer_cards) < len(data["dealer_hand"]):
@@ -603,13 +697,10 @@ class BlackjackScene(Scene):
             new_card = Card(self, BLACKJACK_CARD_START_LOCATION)
 
             self.dealer_cards.append(new_card)
-            self.blackjack_cards.append(new_card)
 
             # Setup card identity and target coordinates.
             new_card.set_front(data["dealer_hand"][new_index])
-            new_card.target_location = pygame.Vector2(
-                BLACKJACK_DEALER_LOCATION[0] + BLACKJACK_CARD_HELD_OFFSET * (len(self.dealer_cards) - 1),
-                BLACKJACK_DEALER_LOCATION[1])
+            new_card.target_location = BLACKJACK_DEALER_SLOTS[new_index]
 
             new_card.moving = True
             new_card.move_then_flip = True
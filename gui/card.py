@@ -34,6 +34,8 @@ class Card:
         self.back_surface: pygame.Surface = None
         self.value = 0
 
+        self.scene = scene
+
         # State management for animations
         self.flipping, self.flipped, self.front_showing = False, False, False
         self.moving, self.move_then_flip = False, False
@@ -43,8 +45,6 @@ class Card:
         self.target_location = pygame.Vector2(0,0)
         self.move_time = 0.0
 
-        self.scene = scene
-
         # The container allows the card and its shadow/border to move as one unit
         self.card_container = pygame_gui.elements.UIPanel(
             relative_rect=pygame.Rect(location, (CARD_WIDTH+4, CARD_HEIGHT+4)),
@@ -63,6 +63,37 @@ class Card:
             container=self.card_container,
             object_id=ObjectID(class_id='@card'))
 
+    @property
+    def moving(self):
+        """Whether the card is travelling towards target_location."""
+        return self._moving
+
+    @moving.setter
+    def moving(self, value):
+        self._moving = value
+        self._track(getattr(self.scene, "moving_cards", None), value)
+
+    @property
+    def flipping(self):
+        """Whether the card is partway through a flip."""
+        return self._flipping
+
+    @flipping.setter
+    def flipping(self, value):
+        self._flipping = value
+        self._track(getattr(self.scene, "flipping_cards", None), value)
+
+    def _track(self, active, value):
+        """
+        Keeps the scene's set of animating cards (if it keeps one) in sync,
+        so the scene only has to visit cards that are actually animating.
+        """
+        if active is not None:
+            if value:
+                active.add(self)
+            else:
+                active.discard(self)
+
     def toggle_card_visibility(self):
         """Hides or shows the entire card container and its contents."""
         self.image.visible = not self.image.visible